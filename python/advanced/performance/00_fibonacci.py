@@ -0,0 +1,155 @@
+# 1. Why is the naive Fibonacci slow?
+# The recursive version from the basics part calls itself twice for every `n`, so the same values are computed
+# again and again. The number of calls grows exponentially: `fibonacci(35)` makes about 30 million calls.
+# It also recurses `n` levels deep, so a large `n` raises `RecursionError`.
+
+def fibonacci_naive(n):
+    if n <= 1:
+        return n  # Base case
+    else:
+        return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
+
+print(fibonacci_naive(6))  # Output: 8
+
+# 2. Memoized Recursion
+# `functools.lru_cache` stores the result of every call, so each value is computed only once.
+# The number of calls drops from exponential to linear, but the recursion is still `n` levels deep.
+# The cache is bounded: F(i) has about 0.7 * i bits, so keeping every value up to `n` would use O(n²) bits
+# (about 430 MB for n = 100_000) for the whole life of the program. The least recently used values are
+# dropped once `CACHE_SIZE` values are stored, and the recursion only needs the last few.
+
+from functools import lru_cache
+
+CACHE_SIZE = 512
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _fibonacci_cached(n):
+    if n <= 1:
+        return n
+    return _fibonacci_cached(n - 1) + _fibonacci_cached(n - 2)
+
+# To avoid `RecursionError` we fill the cache in small steps: every call then only recurses
+# down to the last cached value instead of all the way down to 0.
+# A step must fit in the cache, otherwise the value it recurses down to would already be dropped.
+def fibonacci_memoized(n, step=200):
+    if n < 0:
+        raise ValueError("n must be non-negative.")
+    step = min(step, CACHE_SIZE // 2)
+    for i in range(step, n, step):
+        _fibonacci_cached(i)
+    return _fibonacci_cached(n)
+
+print(fibonacci_memoized(2000) % 1000)  # Output: 125
+print(_fibonacci_cached.cache_info().currsize)  # Output: 512 (not 2001)
+
+# 3. Iterative Version
+# We only ever need the two previous values, so a loop with two variables does the job in O(n) time
+# and O(1) memory, without any recursion.
+
+def fibonacci_iterative(n):
+    if n < 0:
+        raise ValueError("n must be non-negative.")
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+print(fibonacci_iterative(6))  # Output: 8
+
+# 4. Fast Doubling (O(log n))
+# The matrix form [[1, 1], [1, 0]] ** n = [[F(n+1), F(n)], [F(n), F(n-1)]] gives two identities:
+# - F(2k)   = F(k) * (2 * F(k+1) - F(k))
+# - F(2k+1) = F(k) ** 2 + F(k+1) ** 2
+# Walking over the bits of `n` from the most significant one, each step doubles `k` (and adds 1 when the bit is set),
+# so only about log2(n) steps of big-int multiplication are needed.
+
+def _fibonacci_pair(n):
+    # Returns (F(n), F(n + 1))
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k + 1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+def fibonacci_fast_doubling(n):
+    if n < 0:
+        raise ValueError("n must be non-negative.")
+    return _fibonacci_pair(n)[0]
+
+print(fibonacci_fast_doubling(6))  # Output: 8
+print(fibonacci_fast_doubling(100_000).bit_length())  # Output: 69424 (number of bits)
+
+# 5. Pluggable Strategies
+# A dictionary maps a strategy name to a function, so the caller can choose the algorithm
+# without changing the code that uses it.
+
+FIBONACCI_STRATEGIES = {
+    "naive": fibonacci_naive,
+    "memoized": fibonacci_memoized,
+    "iterative": fibonacci_iterative,
+    "fast_doubling": fibonacci_fast_doubling,
+}
+
+def fibonacci(n, strategy="fast_doubling"):
+    try:
+        func = FIBONACCI_STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown strategy: {strategy!r}") from None
+    return func(n)
+
+print(fibonacci(10))                        # Output: 55
+print(fibonacci(10, strategy="iterative"))  # Output: 55
+
+# 6. Streaming a Range of Values
+# When we need many consecutive values, computing each one from scratch wastes work.
+# `fibonacci_range` jumps to `start` with fast doubling, then yields each next value with a single addition.
+
+def fibonacci_range(start, stop):
+    if start < 0:
+        raise ValueError("start must be non-negative.")
+    if start >= stop:
+        return
+    a, b = _fibonacci_pair(start)
+    for _ in range(start, stop):
+        yield a
+        a, b = b, a + b
+
+print(list(fibonacci_range(0, 10)))  # Output: [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+print(list(fibonacci_range(50, 53)))  # Output: [12586269025, 20365011074, 32951280099]
+
+# 7. Benchmark
+# `timeit` runs a callable several times and returns the total time, which is more reliable than a single measurement.
+# The naive version is only measured for a small `n`, otherwise it would run for minutes.
+
+import timeit
+
+def benchmark_fibonacci(small_n=25, large_n=20_000, number=3):
+    print(f"fibonacci({small_n}):")
+    for name, func in FIBONACCI_STRATEGIES.items():
+        _fibonacci_cached.cache_clear()  # Measure a cold cache for a fair comparison
+        seconds = timeit.timeit(lambda: func(small_n), number=number) / number
+        print(f"  {name:<14} {seconds * 1000:10.3f} ms")
+
+    print(f"fibonacci({large_n}):")
+    for name, func in FIBONACCI_STRATEGIES.items():
+        if name == "naive":
+            continue  # Exponential time, would never finish
+        _fibonacci_cached.cache_clear()
+        seconds = timeit.timeit(lambda: func(large_n), number=number) / number
+        print(f"  {name:<14} {seconds * 1000:10.3f} ms")
+
+benchmark_fibonacci()
+# Output (times depend on your machine):
+# fibonacci(25):
+#   naive              ~20 ms
+#   memoized          ~0.01 ms
+#   iterative        ~0.004 ms
+#   fast_doubling    ~0.006 ms
+# fibonacci(20000):
+#   memoized           ~10 ms
+#   iterative           ~8 ms
+#   fast_doubling      ~0.2 ms
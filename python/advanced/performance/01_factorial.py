@@ -0,0 +1,124 @@
+# 1. Problems with the recursive factorial
+# The version from the basics part recurses once per `n`:
+# - It raises `RecursionError` for `n` above ~1000 (the default recursion limit).
+# - Its base case is `n == 1`, so `factorial(0)` or a negative `n` never stops.
+# - It multiplies a huge number by a small one `n` times, which is the slowest way to build a big product.
+
+def factorial_recursive(n):
+    if n == 1:
+        return 1  # Base case
+    else:
+        return n * factorial_recursive(n - 1)
+
+print(factorial_recursive(5))  # Output: 120
+
+# 2. Product Tree Multiplication
+# Multiplying big integers is cheaper when both operands have a similar size.
+# Instead of `((1 * 2) * 3) * 4 ...`, we split the range in two halves, compute each half recursively and multiply
+# the two results. The recursion depth is only log2(n), so there is no risk of `RecursionError`.
+
+def range_product(low, high):
+    # Product of all integers in [low, high]
+    if low > high:
+        return 1
+    if high - low < 8:
+        result = low
+        for i in range(low + 1, high + 1):
+            result *= i
+        return result
+    middle = (low + high) // 2
+    return range_product(low, middle) * range_product(middle + 1, high)
+
+def factorial(n):
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers.")
+    return range_product(2, n)
+
+print(factorial(0))   # Output: 1
+print(factorial(5))   # Output: 120
+print(factorial(100_000).bit_length())  # Output: 1516705 (number of bits)
+
+# 3. Checkpoint Cache
+# When `factorial(k)` is called many times with close values of `k`, we can reuse a previous result:
+# if `m!` is cached and `m <= k`, then `k! = m! * (m + 1) * ... * k`.
+# The cache is bounded: when it is full, the least recently used checkpoint is removed (`OrderedDict` keeps the order).
+
+from collections import OrderedDict
+
+class FactorialCache:
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._checkpoints = OrderedDict()
+
+    def __call__(self, n):
+        if n < 0:
+            raise ValueError("Factorial is not defined for negative numbers.")
+        start, value = self._nearest(n)
+        if start != n:
+            value *= range_product(start + 1, n)
+            self._store(n, value)
+        return value
+
+    def _nearest(self, n):
+        # Largest cached checkpoint that is not bigger than `n`
+        best = max((k for k in self._checkpoints if k <= n), default=None)
+        if best is None:
+            return 1, 1
+        self._checkpoints.move_to_end(best)  # Mark as recently used
+        return best, self._checkpoints[best]
+
+    def _store(self, n, value):
+        if self.maxsize <= 0:
+            return
+        self._checkpoints[n] = value
+        if len(self._checkpoints) > self.maxsize:
+            self._checkpoints.popitem(last=False)  # Remove the least recently used checkpoint
+
+    def clear(self):
+        self._checkpoints.clear()
+
+cached_factorial = FactorialCache(maxsize=16)
+print(cached_factorial(10))  # Output: 3628800
+print(cached_factorial(12))  # Output: 479001600 (only 11 * 12 is computed)
+
+# 4. Benchmark
+# The recursive version is measured with `n = 900` to stay below the recursion limit.
+# `math.factorial` is implemented in C and is shown as a reference.
+
+import math
+import timeit
+
+def benchmark_factorial(small_n=900, large_n=20_000, number=5):
+    print(f"factorial({small_n}):")
+    candidates = {
+        "recursive": factorial_recursive,
+        "product_tree": factorial,
+        "math.factorial": math.factorial,
+    }
+    for name, func in candidates.items():
+        seconds = timeit.timeit(lambda: func(small_n), number=number) / number
+        print(f"  {name:<16} {seconds * 1000:10.3f} ms")
+
+    print(f"factorial({large_n}):")
+    chain = lambda n: math.prod(range(2, n + 1))  # One long multiplication chain
+    for name, func in {"chain": chain, "product_tree": factorial, "math.factorial": math.factorial}.items():
+        seconds = timeit.timeit(lambda: func(large_n), number=number) / number
+        print(f"  {name:<16} {seconds * 1000:10.3f} ms")
+
+    # Repeated calls with close values of `n` reuse the nearest checkpoint
+    cache = FactorialCache(maxsize=16)
+    cache(large_n)
+    seconds = timeit.timeit(lambda: cache(large_n + 100), number=1)  # Only the first call is a partial product
+    print(f"  {'cached (+100)':<16} {seconds * 1000:10.3f} ms")
+
+benchmark_factorial()
+# Output (times depend on your machine):
+# factorial(900):
+#   recursive            ~0.3 ms
+#   product_tree         ~0.1 ms
+#   math.factorial      ~0.02 ms
+# factorial(20000):
+#   chain                ~120 ms
+#   product_tree          ~20 ms
+#   math.factorial        ~15 ms
+#   cached (+100)        ~0.2 ms
@@ -0,0 +1,194 @@
+# 1. The cost of a logging decorator
+# The `log_decorator` from the basics part formats and prints two strings on every call.
+# Printing is slow (it writes to a stream and may flush), so wrapping a small hot function with it
+# makes the function many times slower. We can't leave such a decorator in production code.
+
+def log_decorator(func):
+    def wrapper(*args, **kwargs):
+        print(f"Calling {func.__name__}")
+        result = func(*args, **kwargs)
+        print(f"{func.__name__} returned {result}")
+        return result
+    return wrapper
+
+# 2. Zero overhead when disabled
+# A decorator runs once, when the function is defined. If instrumentation is disabled at that moment,
+# the decorator can return the original function itself: calls then cost exactly nothing extra.
+
+import functools
+
+def instrument_if(enabled):
+    def decorator(func):
+        if not enabled:
+            return func  # No wrapper at all
+        return log_decorator(func)
+    return decorator
+
+@instrument_if(False)
+def add(a, b):
+    return a + b
+
+print(add(3, 5))         # Output: 8 (nothing else is printed)
+print(add.__name__)      # Output: add
+
+# 3. Lock-free per-function statistics
+# Instead of printing, we record numbers: call count, errors, total wall and CPU time, and a latency histogram.
+# Incrementing a shared counter from several threads is not atomic, and a lock on every call is expensive.
+# So each thread gets its own "shard" of counters (`threading.local`): threads never write to the same object.
+# A lock is only taken once per thread, to register its shard, and when the shards are merged for a report.
+# The histogram uses powers of two: a call that took `ns` nanoseconds goes into bucket `ns.bit_length()`.
+
+import threading
+
+HISTOGRAM_BUCKETS = 64
+
+class _StatsShard:
+    def __init__(self):
+        self.calls = 0
+        self.sampled = 0
+        self.errors = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+class FunctionStats:
+    def __init__(self, name):
+        self.name = name
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _StatsShard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def snapshot(self):
+        total = _StatsShard()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            total.calls += shard.calls
+            total.sampled += shard.sampled
+            total.errors += shard.errors
+            total.wall_ns += shard.wall_ns
+            total.cpu_ns += shard.cpu_ns
+            for i, count in enumerate(shard.histogram):
+                total.histogram[i] += count
+        return {
+            "calls": total.calls,
+            "sampled": total.sampled,
+            "errors": total.errors,
+            "wall_ns_total": total.wall_ns,
+            "cpu_ns_total": total.cpu_ns,
+            "wall_ns_mean": total.wall_ns // total.sampled if total.sampled else 0,
+            # Bucket label is the upper bound (exclusive) of the latency in nanoseconds
+            "histogram": {str(1 << i): count for i, count in enumerate(total.histogram) if count},
+        }
+
+    def reset(self):
+        with self._lock:
+            self._shards.clear()
+        self._local = threading.local()
+
+# 4. Sampling and timing
+# `instrument` measures only one call out of `sample_rate`, which keeps the overhead low on very hot functions.
+# - `time.perf_counter_ns()` gives the wall clock time as an integer (no float rounding).
+# - `time.thread_time_ns()` gives the CPU time of the current thread, so time spent waiting (I/O, sleep) is excluded.
+# All statistics are kept in a registry, keyed by the qualified name of the function.
+
+import time
+
+STATS_REGISTRY = {}
+
+def instrument(enabled=True, sample_rate=1, name=None):
+    if sample_rate < 1:
+        raise ValueError("sample_rate must be at least 1.")
+
+    def decorator(func):
+        if not enabled:
+            return func
+        key = name or f"{func.__module__}.{func.__qualname__}"
+        stats = STATS_REGISTRY.setdefault(key, FunctionStats(key))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            shard = stats.shard()
+            shard.calls += 1
+            if shard.calls % sample_rate:
+                return func(*args, **kwargs)  # Not sampled: only the call is counted
+            wall_start = time.perf_counter_ns()
+            cpu_start = time.thread_time_ns()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                shard.errors += 1
+                raise
+            finally:
+                wall = time.perf_counter_ns() - wall_start
+                shard.cpu_ns += time.thread_time_ns() - cpu_start
+                shard.wall_ns += wall
+                shard.sampled += 1
+                shard.histogram[min(wall.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+        wrapper.stats = stats
+        return wrapper
+    return decorator
+
+# 5. Dumping statistics as JSON
+# The merged statistics are plain dictionaries, so they can be written to a log or sent to a monitoring system.
+
+import json
+
+def dump_stats(indent=None):
+    return json.dumps({key: stats.snapshot() for key, stats in STATS_REGISTRY.items()}, indent=indent)
+
+@instrument(sample_rate=10, name="multiply")
+def multiply(a, b):
+    return a * b
+
+for i in range(1000):
+    multiply(i, 2)
+
+snapshot = multiply.stats.snapshot()
+print(snapshot["calls"], snapshot["sampled"])  # Output: 1000 100
+print(dump_stats())
+# Output (times depend on your machine):
+# {"multiply": {"calls": 1000, "sampled": 100, "errors": 0, "wall_ns_total": 102401, ..., "histogram": {"1024": 82, "2048": 18}}}
+
+# 6. Benchmark
+# We compare the cost of calling a tiny function: plain, with the original `log_decorator`
+# (its output is redirected to a string buffer), disabled, sampled and fully instrumented.
+
+import contextlib
+import io
+import timeit
+
+def benchmark_instrumentation(number=200_000):
+    def plain(a, b):
+        return a + b
+
+    candidates = {
+        "plain": plain,
+        "log_decorator": log_decorator(plain),
+        "disabled": instrument(enabled=False)(plain),
+        "sampled 1/100": instrument(sample_rate=100, name="bench.sampled")(plain),
+        "instrumented": instrument(name="bench.full")(plain),
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = {name: timeit.timeit(lambda: func(1, 2), number=number) for name, func in candidates.items()}
+    for name, seconds in results.items():
+        print(f"{name:<14} {seconds / number * 1e9:8.1f} ns per call")
+
+benchmark_instrumentation()
+# Output (times depend on your machine):
+# plain              ~80 ns per call
+# log_decorator    ~2000 ns per call
+# disabled           ~80 ns per call
+# sampled 1/100     ~400 ns per call
+# instrumented     ~1900 ns per call
@@ -0,0 +1,218 @@
+# 1. Why is the basic `BankAccount` not thread-safe?
+# `self._balance += amount` is not atomic: Python reads the balance, adds the amount, then writes it back.
+# If two threads do this at the same time, one of the updates can be lost.
+# The basics version also reports insufficient funds with `print`, so the caller can't react to the failure.
+
+class BankAccount:
+    def __init__(self, balance):
+        self._balance = balance  # Protected attribute (convention, not enforced)
+
+    def deposit(self, amount):
+        self._balance += amount
+
+    def withdraw(self, amount):
+        if amount > self._balance:
+            print("Insufficient funds!")
+        else:
+            self._balance -= amount
+
+    def get_balance(self):
+        return self._balance
+
+# 2. Reporting errors with exceptions
+# A custom exception lets the caller decide what to do (retry, reject the request, log it...).
+
+class InsufficientFundsError(Exception):
+    pass
+
+class UnknownAccountError(KeyError):
+    pass
+
+# 3. Striped locks
+# One lock per account is simple but costs memory with millions of accounts, and a single global lock makes all
+# threads wait for each other. Lock striping is in between: a fixed number of locks, and each account uses the lock
+# at index `hash(account_id) % number_of_stripes`. Two accounts may share a lock, which is fine for correctness.
+#
+# 4. Deadlock-free transfers
+# A transfer needs the locks of both accounts. If thread 1 locks A then B while thread 2 locks B then A,
+# they can wait for each other forever (deadlock). Always acquiring the locks in the same global order
+# (by stripe index) makes this impossible.
+#
+# 5. Append-only ledger
+# Every successful operation is recorded as an immutable `LedgerEntry`. Sequence numbers come from
+# `itertools.count`, and `list.append` is atomic in CPython, so the ledger does not need its own lock.
+
+import itertools
+import threading
+from collections import defaultdict, namedtuple
+
+LedgerEntry = namedtuple("LedgerEntry", ["sequence", "account_id", "amount", "balance"])
+
+class AccountStore:
+    def __init__(self, stripes=64):
+        self._balances = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._sequence = itertools.count()
+        self.ledger = []
+
+    def _stripe(self, account_id):
+        return hash(account_id) % len(self._locks)
+
+    def _record(self, account_id, amount, balance):
+        self.ledger.append(LedgerEntry(next(self._sequence), account_id, amount, balance))
+
+    def _apply(self, account_id, amount):
+        # Must be called with the stripe lock of `account_id` held
+        try:
+            balance = self._balances[account_id]
+        except KeyError:
+            raise UnknownAccountError(account_id) from None
+        if balance + amount < 0:
+            raise InsufficientFundsError(f"Account {account_id!r} has {balance}, cannot withdraw {-amount}.")
+        balance += amount
+        self._balances[account_id] = balance
+        self._record(account_id, amount, balance)
+
+    def open_account(self, account_id, balance=0):
+        with self._locks[self._stripe(account_id)]:
+            if account_id in self._balances:
+                raise ValueError(f"Account {account_id!r} already exists.")
+            self._balances[account_id] = balance
+            self._record(account_id, balance, balance)
+
+    def get_balance(self, account_id):
+        with self._locks[self._stripe(account_id)]:
+            return self._balances[account_id]
+
+    def deposit(self, account_id, amount):
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        with self._locks[self._stripe(account_id)]:
+            self._apply(account_id, amount)
+
+    def withdraw(self, account_id, amount):
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        with self._locks[self._stripe(account_id)]:
+            self._apply(account_id, -amount)
+
+    def transfer(self, source, target, amount):
+        if amount <= 0:
+            raise ValueError("Transfer amount must be positive.")
+        stripes = sorted({self._stripe(source), self._stripe(target)})  # Global lock order
+        for index in stripes:
+            self._locks[index].acquire()
+        try:
+            if target not in self._balances:
+                raise UnknownAccountError(target)
+            self._apply(source, -amount)  # Checks the funds before anything is changed
+            self._apply(target, amount)
+        finally:
+            for index in reversed(stripes):
+                self._locks[index].release()
+
+    # 6. Batched transactions
+    # `apply_transactions` takes (account_id, amount) pairs, where a negative amount is a withdrawal.
+    # Transactions are grouped by stripe, so each lock is acquired once per batch instead of once per transaction.
+    # The order of the transactions of one account is preserved. Failed transactions are returned with their error.
+    def apply_transactions(self, transactions):
+        by_stripe = defaultdict(list)
+        for account_id, amount in transactions:
+            by_stripe[self._stripe(account_id)].append((account_id, amount))
+        failed = []
+        for index, items in by_stripe.items():
+            with self._locks[index]:
+                for account_id, amount in items:
+                    try:
+                        self._apply(account_id, amount)
+                    except (InsufficientFundsError, UnknownAccountError) as e:
+                        failed.append((account_id, amount, e))
+        return failed
+
+    def total(self):
+        # Lock every stripe (in order) to get a consistent snapshot
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return sum(self._balances.values())
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+store = AccountStore()
+store.open_account("alice", 1000)
+store.open_account("bob", 500)
+store.transfer("alice", "bob", 300)
+print(store.get_balance("alice"), store.get_balance("bob"))  # Output: 700 800
+
+try:
+    store.withdraw("bob", 2000)
+except InsufficientFundsError as e:
+    print(e)  # Output: Account 'bob' has 800, cannot withdraw 2000.
+
+failed = store.apply_transactions([("alice", 50), ("bob", -100), ("bob", -5000)])
+print(store.get_balance("alice"), store.get_balance("bob"))  # Output: 750 700
+print(len(failed))                                           # Output: 1
+print(store.ledger[-1])  # Output: LedgerEntry(sequence=5, account_id='bob', amount=-100, balance=700)
+
+# 7. Stress benchmark
+# Many threads make random transfers between accounts. Transfers only move money, so the total must stay the same,
+# and no balance may become negative. We compare one global lock (1 stripe), striped locks,
+# and batched deposits/withdrawals.
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+def _transfer_worker(store, account_ids, count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        source, target = rng.sample(account_ids, 2)
+        try:
+            store.transfer(source, target, rng.randint(1, 50))
+        except InsufficientFundsError:
+            pass
+
+def _batch_worker(store, account_ids, count, seed):
+    rng = random.Random(seed)
+    # Pairs of deposit/withdrawal of the same amount: the total stays the same
+    transactions = []
+    for _ in range(count // 2):
+        amount = rng.randint(1, 50)
+        transactions.append((rng.choice(account_ids), amount))
+        transactions.append((rng.choice(account_ids), -amount))
+    return store.apply_transactions(transactions)
+
+def benchmark_accounts(accounts=1000, threads=8, operations_per_thread=20_000):
+    account_ids = list(range(accounts))
+    for name, stripes, worker in (
+        ("global lock", 1, _transfer_worker),
+        ("striped", 64, _transfer_worker),
+        ("batched", 64, _batch_worker),
+    ):
+        store = AccountStore(stripes=stripes)
+        for account_id in account_ids:
+            store.open_account(account_id, 1000)
+        expected_total = store.total()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [pool.submit(worker, store, account_ids, operations_per_thread, seed) for seed in range(threads)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+        total = store.total()
+        if worker is _batch_worker:
+            # Withdrawals that failed did not happen: add them back to the expected total
+            expected_total += sum(-amount for failures in results for _, amount, _ in failures)
+        consistent = total == expected_total and min(store._balances.values()) >= 0
+        operations = threads * operations_per_thread
+        print(f"{name:<12} {operations / elapsed:>10.0f} ops/s  consistent: {consistent}")
+
+benchmark_accounts()
+# Output (numbers depend on your machine):
+# global lock      ~130000 ops/s  consistent: True
+# striped          ~130000 ops/s  consistent: True
+# batched          ~300000 ops/s  consistent: True
+# With the GIL, striping mostly reduces lock contention rather than adding parallelism;
+# batching wins because it takes each lock once per batch.
@@ -0,0 +1,224 @@
+# 1. How much memory does a regular object use?
+# Every instance of a regular class has its own `__dict__` to store its attributes.
+# That dictionary is allocated per object, on top of the object itself, which adds up with millions of instances.
+
+import sys
+
+class Animal:
+    def __init__(self, name):
+        self.name = name
+
+    def speak(self):
+        print(f"{self.name} makes a sound.")
+
+class Dog(Animal):
+    species = "Canis lupus familiaris"  # Class variable (shared by all dogs)
+
+    def __init__(self, name, breed):
+        super().__init__(name)
+        self.breed = breed
+
+    def bark(self):
+        print(f"{self.name} says woof!")
+
+class Cat(Animal):
+    species = "Felis catus"
+
+    def speak(self):
+        print(f"{self.name} says meow!")
+
+dog = Dog("Buddy", "Golden Retriever")
+print(dog.__dict__)  # Output: {'name': 'Buddy', 'breed': 'Golden Retriever'}
+
+# 2. `__slots__` versions
+# `__slots__` replaces the per-instance `__dict__` with fixed storage for the listed attributes.
+# Each class of the hierarchy only lists its own new attributes. If a subclass does not define `__slots__`,
+# its instances get a `__dict__` again, so `SlottedCat` defines an empty `__slots__`.
+
+class SlottedAnimal:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def speak(self):
+        print(f"{self.name} makes a sound.")
+
+class SlottedDog(SlottedAnimal):
+    __slots__ = ("breed",)
+    species = "Canis lupus familiaris"
+
+    def __init__(self, name, breed):
+        super().__init__(name)
+        self.breed = breed
+
+    def bark(self):
+        print(f"{self.name} says woof!")
+
+class SlottedCat(SlottedAnimal):
+    __slots__ = ()
+    species = "Felis catus"
+
+    def speak(self):
+        print(f"{self.name} says meow!")
+
+slotted_dog = SlottedDog("Buddy", "Golden Retriever")
+slotted_dog.bark()                        # Output: Buddy says woof!
+print(hasattr(slotted_dog, "__dict__"))   # Output: False
+
+try:
+    slotted_dog.age = 3
+except AttributeError as e:
+    print(e)  # Output: 'SlottedDog' object has no attribute 'age'
+
+# 3. Dictionary-encoded string columns
+# Many records share the same strings (breeds, species, even names). A `StringColumn` stores every distinct
+# string once in a table, interned with `sys.intern`, and each record only keeps a 4-byte code in an `array('I')`.
+
+from array import array
+
+class StringColumn:
+    def __init__(self):
+        self.codes = array("I")
+        self.values = []  # code -> string
+        self._index = {}  # string -> code
+
+    def _encode(self, value):
+        try:
+            return self._index[value]
+        except KeyError:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.values.append(value)
+            self._index[value] = code
+            return code
+
+    def append(self, value):
+        self.codes.append(self._encode(value))
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index, value):
+        self.codes[index] = self._encode(value)
+
+    def __len__(self):
+        return len(self.codes)
+
+# 4. Struct of arrays with `Dog`-like views
+# Instead of one object per dog ("array of structs"), `DogRecords` keeps one column per attribute
+# ("struct of arrays"). Nothing is allocated per record except the codes in the columns.
+# Indexing returns a small `DogView` that reads and writes the columns, so the code using it looks like
+# it uses a `Dog`. Views are created on access only and can be thrown away.
+
+class DogView:
+    __slots__ = ("_records", "_index")
+    species = Dog.species
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    @property
+    def name(self):
+        return self._records.names[self._index]
+
+    @name.setter
+    def name(self, value):
+        self._records.names[self._index] = value
+
+    @property
+    def breed(self):
+        return self._records.breeds[self._index]
+
+    @breed.setter
+    def breed(self, value):
+        self._records.breeds[self._index] = value
+
+    def bark(self):
+        print(f"{self.name} says woof!")
+
+    def __str__(self):
+        return f"{self.name} is a {self.breed}"
+
+class DogRecords:
+    def __init__(self):
+        self.names = StringColumn()
+        self.breeds = StringColumn()
+
+    def append(self, name, breed):
+        self.names.append(name)
+        self.breeds.append(breed)
+        return len(self.names) - 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DogRecords index out of range")
+        return DogView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield DogView(self, index)
+
+    # Column operations don't need any view: they work on the codes directly
+    def count_by_breed(self):
+        counts = [0] * len(self.breeds.values)
+        for code in self.breeds.codes:
+            counts[code] += 1
+        return dict(zip(self.breeds.values, counts))
+
+dogs = DogRecords()
+dogs.append("Buddy", "Golden Retriever")
+dogs.append("Max", "Bulldog")
+dogs.append("Rex", "Bulldog")
+print(dogs[1])               # Output: Max is a Bulldog
+dogs[0].bark()               # Output: Buddy says woof!
+dogs[2].breed = "Beagle"
+print(dogs.count_by_breed())  # Output: {'Golden Retriever': 1, 'Bulldog': 1, 'Beagle': 1}
+
+# 5. Measuring memory with `tracemalloc`
+# `tracemalloc` records every memory allocation made by Python. The difference of traced memory before and after
+# building the records, divided by their number, gives the bytes per object.
+# All three versions reuse the same name and breed strings, so only the storage itself is measured.
+
+import tracemalloc
+
+BREEDS = ["Golden Retriever", "Bulldog", "Beagle", "Poodle", "Labrador"]
+
+def _bytes_per_record(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return (after - before) / count
+
+def benchmark_memory(count=100_000):
+    names = [f"Dog{i % 1000}" for i in range(1000)]
+
+    def build_dicts():
+        return [Dog(names[i % 1000], BREEDS[i % 5]) for i in range(count)]
+
+    def build_slotted():
+        return [SlottedDog(names[i % 1000], BREEDS[i % 5]) for i in range(count)]
+
+    def build_columnar():
+        records = DogRecords()
+        for i in range(count):
+            records.append(names[i % 1000], BREEDS[i % 5])
+        return records
+
+    for name, build in (("dict", build_dicts), ("slotted", build_slotted), ("columnar", build_columnar)):
+        print(f"{name:<9} {_bytes_per_record(build, count):6.1f} bytes per dog")
+
+benchmark_memory()
+# Output (numbers depend on your Python version):
+# dict          ~96 bytes per dog
+# slotted       ~56 bytes per dog
+# columnar      ~11 bytes per dog (two 4-byte codes, plus the spare capacity of the arrays)
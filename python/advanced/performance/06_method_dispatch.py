@@ -0,0 +1,147 @@
+# 1. How does `bird.speak()` find the method?
+# For each call, Python looks for `speak` in the instance `__dict__`, then in each class of the MRO
+# (method resolution order), and creates a bound method object. CPython 3.11+ caches part of this work
+# inside the bytecode, but the lookup still happens for every object.
+# In this file `speak()` returns its message instead of printing it, so benchmarks measure the dispatch, not `print`.
+
+class Bird:
+    def speak(self):
+        return "Bird makes a sound."
+
+class Parrot(Bird):
+    def speak(self):
+        return "Parrot says hello!"
+
+class Crow(Bird):
+    def speak(self):
+        return "Crow caws!"
+
+print(Parrot.__mro__)  # Output: (<class '__main__.Parrot'>, <class '__main__.Bird'>, <class 'object'>)
+
+# 2. Dispatch table
+# The method found for a class is the same for all its instances. A `DispatchTable` resolves it once
+# per concrete class with `getattr(cls, name)` (a plain function) and stores it in a dictionary.
+# Calling the function with the object as argument is the same as calling the bound method.
+
+from collections import defaultdict
+import weakref
+
+class DispatchTable:
+    def __init__(self, method_name):
+        self.method_name = method_name
+        self._functions = {}
+        _DISPATCH_TABLES.add(self)
+
+    def lookup(self, cls):
+        try:
+            return self._functions[cls]
+        except KeyError:
+            function = getattr(cls, self.method_name)
+            self._functions[cls] = function
+            return function
+
+    def invalidate(self):
+        self._functions.clear()
+
+    # 3. Batch calls grouped by type
+    # `call_all` looks up the function once per class present in `objs` instead of once per object.
+    # - `ordered=True` returns the results in the order of `objs`.
+    # - `ordered=False` groups the objects by class first, then calls `call_groups`: the results come class by class.
+    # `call_groups` calls `map(function, group)` for each class, without any Python-level loop per object.
+    # The grouping itself costs a loop, so the biggest gain is for code that keeps its objects grouped
+    # by type (for example one list per event type) and calls `call_groups` directly.
+    def call_all(self, objs, ordered=True):
+        if ordered:
+            functions = self._functions
+            lookup = self.lookup
+            return [(functions.get(type(obj)) or lookup(type(obj)))(obj) for obj in objs]
+        return self.call_groups(group_by_type(objs))
+
+    def call_groups(self, groups):
+        results = []
+        for cls, group in groups.items():
+            results.extend(map(self.lookup(cls), group))
+        return results
+
+def group_by_type(objs):
+    groups = defaultdict(list)
+    for obj in objs:
+        groups[type(obj)].append(obj)
+    return groups
+
+# 4. Invalidating the cache when a class changes
+# A class can be modified at runtime (`Parrot.speak = new_function`, `del Crow.speak`...). The cached function
+# would then be wrong. A metaclass can intercept these changes: `type.__setattr__` and `type.__delattr__`
+# are called whenever an attribute of the class itself is set or deleted. Changing a base class can change the method
+# of all its subclasses, and class changes are rare, so we simply clear every dispatch table.
+# Only classes created with `DispatchMeta` are tracked.
+
+_DISPATCH_TABLES = weakref.WeakSet()
+
+class DispatchMeta(type):
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        for table in list(_DISPATCH_TABLES):
+            table.invalidate()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        for table in list(_DISPATCH_TABLES):
+            table.invalidate()
+
+class Bird(metaclass=DispatchMeta):
+    def speak(self):
+        return "Bird makes a sound."
+
+class Parrot(Bird):
+    def speak(self):
+        return "Parrot says hello!"
+
+class Crow(Bird):
+    def speak(self):
+        return "Crow caws!"
+
+speak_table = DispatchTable("speak")
+
+def speak_all(objs, ordered=True):
+    return speak_table.call_all(objs, ordered)
+
+birds = [Parrot(), Crow(), Parrot(), Bird()]
+print(speak_all(birds))
+# Output: ['Parrot says hello!', 'Crow caws!', 'Parrot says hello!', 'Bird makes a sound.']
+print(speak_all(birds, ordered=False))
+# Output: ['Parrot says hello!', 'Parrot says hello!', 'Crow caws!', 'Bird makes a sound.']
+
+Crow.speak = lambda self: "Crow croaks!"  # The class changes: the table is cleared
+print(speak_all([Crow()]))                # Output: ['Crow croaks!']
+del Crow.speak                            # Crow now inherits `Bird.speak`
+print(speak_all([Crow()]))                # Output: ['Bird makes a sound.']
+
+# 5. Microbenchmark
+# We compare the plain loop with the dispatch table: ordered, grouped by class, and on objects already grouped by class.
+# Results vary a lot between Python versions: the specializing interpreter of 3.11+ makes the plain loop fast,
+# so measure on your own version before choosing.
+
+import random
+import timeit
+
+def benchmark_dispatch(count=100_000, number=20):
+    rng = random.Random(0)
+    objs = [rng.choice((Bird, Parrot, Crow))() for _ in range(count)]
+    groups = group_by_type(objs)  # Objects kept grouped by type, as an event loop could do
+    candidates = {
+        "plain loop": lambda: [bird.speak() for bird in objs],
+        "table (ordered)": lambda: speak_all(objs),
+        "table (grouped)": lambda: speak_all(objs, ordered=False),
+        "pre-grouped": lambda: speak_table.call_groups(groups),
+    }
+    for name, func in candidates.items():
+        seconds = timeit.timeit(func, number=number) / number
+        print(f"{name:<16} {seconds / count * 1e9:6.1f} ns per call")
+
+benchmark_dispatch()
+# Output (numbers depend on your machine and Python version):
+# plain loop        ~65 ns per call
+# table (ordered)   ~85 ns per call
+# table (grouped)   ~95 ns per call
+# pre-grouped       ~55 ns per call
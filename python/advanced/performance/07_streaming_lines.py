@@ -0,0 +1,146 @@
+# 1. The three reading patterns of the basics part
+# - `file.read()` loads the whole file in memory: impossible with a file of several GB.
+# - `file.readlines()` also loads everything, as a list of strings (even more memory).
+# - `while line: line = file.readline()` keeps memory low, but pays a method call and a decoding step per line.
+
+def read_all(path):
+    with open(path, "r") as file:
+        return file.read().count("\n")
+
+def read_lines(path):
+    with open(path, "r") as file:
+        return len(file.readlines())
+
+def read_line_by_line(path):
+    count = 0
+    with open(path, "r") as file:
+        line = file.readline()
+        while line:
+            count += 1
+            line = file.readline()
+    return count
+
+# 2. Reading big binary chunks
+# Reading a file in binary mode with large fixed-size chunks (1 MB here) makes few system calls.
+# Each chunk is split on b"\n" with one call to `split` (done in C), so the cost per line is small.
+# A chunk usually ends in the middle of a line: that partial line is kept and joined with the next chunk.
+# A line longer than a chunk is collected in the `pending` list and joined once, to avoid repeated copies.
+#
+# 3. Lazy decoding and `\r\n`
+# Since every block we split ends on a b"\n", it never cuts a UTF-8 character in two. So we can decode
+# a whole block at once (much faster than decoding line by line), only when the consumer asks for the next block.
+# `str(view, encoding)` decodes directly from a `memoryview`, without copying the bytes first.
+# Windows line endings are handled with one `replace("\r\n", "\n")` per block that contains a `\r`.
+# A lone `\r` is not a line separator.
+# If `encoding` is None, lines are returned as `bytes`.
+
+def iter_line_batches(path, chunk_size=1 << 20, encoding="utf-8", errors="strict"):
+    with open(path, "rb", buffering=0) as file:  # No extra buffering layer, our chunks are the buffer
+        pending = []
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            end = chunk.rfind(b"\n")
+            if end == -1:
+                pending.append(chunk)  # No line end yet: keep the partial line
+                continue
+            if pending:
+                end += sum(map(len, pending))
+                pending.append(chunk)
+                chunk = b"".join(pending)
+                pending = []
+            if end + 1 < len(chunk):
+                pending.append(chunk[end + 1:])  # Start of the next line
+            lines = _split_block(memoryview(chunk)[:end + 1], encoding, errors)
+            lines.pop()  # Empty string after the last line end
+            yield lines
+        if pending:
+            # Partial last line, without a final line end
+            tail = _split_block(memoryview(b"".join(pending)), encoding, errors)
+            if tail[-1].endswith("\r" if encoding else b"\r"):
+                tail[-1] = tail[-1][:-1]
+            yield tail
+
+def _split_block(view, encoding, errors):
+    if encoding is None:
+        block = bytes(view)
+        if b"\r" in block:  # Searching is much faster than `replace`, and most files have no `\r`
+            block = block.replace(b"\r\n", b"\n")
+        return block.split(b"\n")
+    block = str(view, encoding, errors)
+    if "\r" in block:
+        block = block.replace("\r\n", "\n")
+    return block.split("\n")
+
+def iter_lines(path, chunk_size=1 << 20, encoding="utf-8", errors="strict"):
+    for batch in iter_line_batches(path, chunk_size, encoding, errors):
+        yield from batch
+
+import os
+import tempfile
+
+example_path = os.path.join(tempfile.mkdtemp(), "example.txt")
+with open(example_path, "wb") as file:
+    file.write("first line\r\nsecond line\nthird line\nno line end".encode("utf-8"))
+
+print(list(iter_lines(example_path)))
+# Output: ['first line', 'second line', 'third line', 'no line end']
+print(list(iter_lines(example_path, chunk_size=4, encoding=None)))
+# Output: [b'first line', b'second line', b'third line', b'no line end']
+
+# 4. Benchmark
+# We write a test file and count its lines with every method. The default size is small so that the file runs quickly:
+# pass `size_mb=1024` for a 1 GB file (`read_all` and `read_lines` then need several GB of memory).
+# Iterating over the file object (`for line in file`) is shown too, as it is the idiomatic way to read lines.
+
+import time
+
+def _count_iter_lines(path):
+    count = 0
+    for _ in iter_lines(path):
+        count += 1
+    return count
+
+def _count_line_batches(path):
+    return sum(len(batch) for batch in iter_line_batches(path))
+
+def _count_for_line(path):
+    count = 0
+    with open(path, "r") as file:
+        for _ in file:
+            count += 1
+    return count
+
+def benchmark_streaming(size_mb=32):
+    path = os.path.join(tempfile.mkdtemp(), "big.txt")
+    line = "2024-01-01 12:00:00 INFO request handled in 12 ms, status=200, path=/api/items\n"
+    lines_per_mb = (1 << 20) // len(line)
+    with open(path, "w") as file:
+        for _ in range(size_mb):
+            file.write(line * lines_per_mb)
+
+    candidates = {
+        "read()": read_all,
+        "readlines()": read_lines,
+        "readline() loop": read_line_by_line,
+        "for line in file": _count_for_line,
+        "iter_lines": _count_iter_lines,
+        "iter_line_batches": _count_line_batches,
+    }
+    for name, func in candidates.items():
+        start = time.perf_counter()
+        count = func(path)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<18} {size_mb / elapsed:8.1f} MB/s  ({count} lines)")
+    os.remove(path)
+
+benchmark_streaming()
+# Output (numbers depend on your machine and disk):
+# read()               ~450 MB/s
+# readlines()          ~380 MB/s
+# readline() loop      ~450 MB/s
+# for line in file     ~600 MB/s
+# iter_lines           ~500 MB/s
+# iter_line_batches    ~750 MB/s
+# Only the streaming versions keep memory constant (about two chunks) on files larger than the available RAM.
@@ -0,0 +1,210 @@
+# 1. Copying a file the simple way
+# The basics part copies `image.jpg` by reading the whole file into `data` and writing it back.
+# Memory grows with the size of the file, and every byte is copied from the kernel to Python and back.
+
+def copy_read_all(source, destination):
+    with open(source, "rb") as file:
+        data = file.read()
+    with open(destination, "wb") as file:
+        file.write(data)
+
+# 2. Zero-copy system calls (Linux)
+# - `os.copy_file_range` asks the kernel to copy a range of bytes from one file to another. The data never
+#   goes through Python, and some file systems (Btrfs, XFS, NFS...) can even share the blocks instead of copying them.
+# - `os.sendfile` copies from a file to another file descriptor inside the kernel. It was made for sockets,
+#   but on Linux the destination can also be a regular file.
+# Both calls may copy less than asked, so they are called in a loop until they return 0 (end of file).
+# The size from `fstat` is only a hint: a file can grow while it is copied, and files like `/proc/self/status`
+# report a size of 0 but still have content.
+# They can fail on some systems or file systems (for example across devices): we then try the next method.
+# Each method returns the number of bytes it copied.
+
+import errno
+import os
+
+FALLBACK_ERRORS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EBADF}
+BUFFER_SIZE = 1 << 20
+
+def _copy_file_range(source_fd, destination_fd, size):
+    offset = 0
+    while True:
+        copied = os.copy_file_range(source_fd, destination_fd, max(size - offset, BUFFER_SIZE), offset, offset)
+        if copied == 0:
+            return offset
+        offset += copied
+
+def _sendfile(source_fd, destination_fd, size):
+    offset = 0
+    while True:
+        copied = os.sendfile(destination_fd, source_fd, offset, max(size - offset, BUFFER_SIZE))
+        if copied == 0:
+            return offset
+        offset += copied
+
+# 3. Fallbacks: `mmap` and `readinto`
+# - `mmap` maps the source file in memory: the operating system loads pages on demand and can drop them again,
+#   so memory does not grow with the file size. We write the mapping in slices of a `memoryview` (no copy in Python).
+# - `readinto` fills an existing `bytearray` instead of creating a new `bytes` object per read.
+#   The same buffer is reused for the whole file, so memory stays at one buffer (1 MB here).
+
+import mmap
+
+def _write_all(destination_fd, view):
+    while view:
+        written = os.write(destination_fd, view)
+        view = view[written:]
+
+def _mmap(source_fd, destination_fd, size):
+    if size == 0:
+        return 0  # An empty file can't be mapped
+    with mmap.mmap(source_fd, size, access=mmap.ACCESS_READ) as mapping:
+        view = memoryview(mapping)
+        try:
+            for start in range(0, size, BUFFER_SIZE):
+                _write_all(destination_fd, view[start:start + BUFFER_SIZE])
+        finally:
+            view.release()  # The mapping can't be closed while a view on it exists
+    return size
+
+def _readinto(source_fd, destination_fd, size):
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    copied = 0
+    with open(source_fd, "rb", buffering=0, closefd=False) as source:
+        while True:
+            count = source.readinto(buffer)
+            if not count:
+                break
+            _write_all(destination_fd, view[:count])
+            copied += count
+    return copied
+
+COPY_METHODS = {}
+if hasattr(os, "copy_file_range"):
+    COPY_METHODS["copy_file_range"] = _copy_file_range
+if hasattr(os, "sendfile") and os.uname().sysname == "Linux":
+    COPY_METHODS["sendfile"] = _sendfile
+COPY_METHODS["mmap"] = _mmap
+COPY_METHODS["readinto"] = _readinto
+
+# 4. The copy utility
+# `copy_file` tries the methods in order and returns the name of the one that worked.
+# If a method fails with an "unsupported" error, the destination is emptied and the next method is tried.
+# The same happens after a short copy: `copy_file_range` returns 0 at once for `/proc` files, and `mmap` only maps
+# the size seen by `fstat`. A copy is complete when nothing can be read after the copied bytes.
+# `preserve_metadata=True` also copies permissions and timestamps with `shutil.copystat`.
+# Opening the destination with "wb" empties it, so copying a file onto itself would destroy it:
+# like `shutil.copyfile`, we raise `shutil.SameFileError` before opening anything.
+
+import shutil
+
+def _same_file(source, destination):
+    try:
+        return os.path.samefile(source, destination)
+    except OSError:  # The destination doesn't exist yet
+        return False
+
+def copy_file(source, destination, preserve_metadata=False, methods=None):
+    if _same_file(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    names = list(methods or COPY_METHODS)
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        for name in names:
+            try:
+                copied = COPY_METHODS[name](src.fileno(), dst.fileno(), size)
+            except OSError as e:
+                if e.errno not in FALLBACK_ERRORS or name == names[-1]:
+                    raise
+            else:
+                if name == names[-1] or not os.pread(src.fileno(), 1, copied):
+                    break
+            os.ftruncate(dst.fileno(), 0)
+            os.lseek(dst.fileno(), 0, os.SEEK_SET)
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    return name
+
+import tempfile
+
+work_dir = tempfile.mkdtemp()
+image_path = os.path.join(work_dir, "image.jpg")
+with open(image_path, "wb") as file:
+    file.write(os.urandom(100_000))
+
+method = copy_file(image_path, os.path.join(work_dir, "new_image.jpg"), preserve_metadata=True)
+print(method)  # Output: copy_file_range (on Linux)
+with open(image_path, "rb") as a, open(os.path.join(work_dir, "new_image.jpg"), "rb") as b:
+    print(a.read() == b.read())  # Output: True
+try:
+    copy_file(image_path, image_path)
+except shutil.SameFileError:
+    print(os.path.getsize(image_path))  # Output: 100000 (the source is left untouched)
+
+status_copy = os.path.join(work_dir, "status.txt")
+print(copy_file("/proc/self/status", status_copy), os.path.getsize(status_copy) > 0)
+# Output: readinto True (on Linux, `mmap` copies 0 bytes and the system calls refuse or copy nothing)
+
+# 5. Copying directory trees with a thread pool
+# The copy system calls release the GIL, so several files can be copied at the same time with threads.
+# Directories are created first (in the main thread), then every file is submitted to the pool.
+
+from concurrent.futures import ThreadPoolExecutor
+
+def copy_tree(source_dir, destination_dir, preserve_metadata=False, workers=8):
+    jobs = []
+    for root, _, files in os.walk(source_dir):
+        target_root = os.path.join(destination_dir, os.path.relpath(root, source_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            jobs.append((os.path.join(root, name), os.path.join(target_root, name)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(copy_file, src, dst, preserve_metadata) for src, dst in jobs]
+        for future in futures:
+            future.result()  # Raises the first error, if any
+    return len(jobs)
+
+tree = os.path.join(work_dir, "tree")
+os.makedirs(os.path.join(tree, "photos"))
+for i in range(5):
+    shutil.copyfile(image_path, os.path.join(tree, "photos", f"image_{i}.jpg"))
+print(copy_tree(tree, os.path.join(work_dir, "tree_copy")))  # Output: 5
+
+# 6. Benchmark
+# Each method copies the same file. The default sizes keep the file quick to run:
+# pass `sizes_mb=(10, 100, 1000, 10_000)` for the full benchmark (make sure you have the disk space).
+# `copy_read_all` is skipped above 1 GB because it needs as much memory as the file size.
+
+import time
+
+def benchmark_copy(sizes_mb=(10, 100)):
+    directory = tempfile.mkdtemp()
+    source = os.path.join(directory, "source.bin")
+    destination = os.path.join(directory, "destination.bin")
+    for size_mb in sizes_mb:
+        with open(source, "wb") as file:
+            chunk = os.urandom(1 << 20)
+            for _ in range(size_mb):
+                file.write(chunk)
+        candidates = {name: (lambda name=name: copy_file(source, destination, methods=[name])) for name in COPY_METHODS}
+        candidates["shutil.copyfile"] = lambda: shutil.copyfile(source, destination)
+        if size_mb <= 1000:
+            candidates["read all"] = lambda: copy_read_all(source, destination)
+        print(f"{size_mb} MB:")
+        for name, func in candidates.items():
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<16} {size_mb / elapsed:8.0f} MB/s")
+    shutil.rmtree(directory)
+
+benchmark_copy()
+# Output (numbers depend on your machine, disk and file system):
+# 10 MB:
+#   copy_file_range     ~2500 MB/s
+#   sendfile            ~1800 MB/s
+#   mmap                 ~700 MB/s
+#   readinto             ~700 MB/s
+#   shutil.copyfile      ~900 MB/s
+#   read all             ~600 MB/s
+# 100 MB: similar ordering, and `read all` also needs 100 MB of memory.
@@ -0,0 +1,198 @@
+# 1. One system call per path
+# `os.path.exists(path)` and `Path(path).exists()` call `stat` on the path, which is a system call.
+# Checking hundreds of thousands of paths means hundreds of thousands of system calls, each one walking the
+# directory tree from the start of the path.
+
+import os
+
+def exists_one_by_one(paths):
+    return {path: os.path.exists(path) for path in paths}
+
+# 2. One `os.scandir` per directory
+# `os.scandir(directory)` lists a whole directory with a few system calls and returns `DirEntry` objects.
+# If we group the paths by parent directory, we can answer "does this file exist?" for all the files of a directory
+# with a single listing and dictionary lookups.
+# - `entry.is_file()` / `entry.is_dir()` are usually free: the type comes with the listing.
+# - `entry.stat()` is free on Windows, but needs one system call on Linux. `DirEntry` caches its result,
+#   and we only call it for the paths that were asked for.
+# - Like `os.path.exists` and `os.stat`, symbolic links are followed: a dangling link doesn't exist,
+#   and its stat result is None.
+# - A directory that can't be listed or checked (`PermissionError`...) doesn't fail the batch: its paths are
+#   checked one by one with `os.stat`, which gives the same answers as `os.path.exists`.
+# - Paths that don't end with a name ("/", "dir/", "." or "..") are not entries of a listing: they are checked
+#   with `os.stat` directly. `os.path.normpath` would remove them, but it also changes the meaning of
+#   "link/.." when "link" is a symbolic link.
+#
+# 3. Caching with mtime-based invalidation
+# The modification time (`st_mtime_ns`) of a directory changes when a file is created, deleted or renamed in it.
+# The cache keeps each listing with the mtime of its directory, and checks the mtime (one `stat` per directory)
+# before reusing it. Two limits to know:
+# - Writing inside an existing file doesn't change the directory mtime, so cached sizes can be stale:
+#   call `invalidate()` if files are modified in place.
+# - Some file systems have a coarse mtime resolution, so two changes very close in time may look the same.
+
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+def _entry_exists(entry):
+    return not entry.is_symlink() or _entry_stat(entry) is not None
+
+def _entry_stat(entry):
+    try:
+        return entry.stat()
+    except OSError:  # A dangling symbolic link, or a file deleted since the listing
+        return None
+
+def _path_stat(path):
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+class ScandirCache:
+    def __init__(self):
+        self._directories = {}  # directory -> (mtime_ns, {name: DirEntry})
+        self._lock = threading.Lock()
+
+    def _entries(self, directory):
+        # Returns None when the directory exists but can't be listed
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            with self._lock:
+                self._directories.pop(directory, None)
+            return {}
+        except OSError:
+            return None
+        cached = self._directories.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(directory) as iterator:
+                entries = {entry.name: entry for entry in iterator}
+        except OSError:
+            return None
+        with self._lock:
+            self._directories[directory] = (mtime, entries)
+        return entries
+
+    def invalidate(self, directory=None):
+        with self._lock:
+            if directory is None:
+                self._directories.clear()
+            else:
+                self._directories.pop(directory, None)
+
+    def _query(self, paths, answer, missing, answer_path, workers):
+        by_directory = defaultdict(list)
+        unlisted = []
+        for path in paths:
+            directory, name = os.path.split(path)
+            if name in ("", ".", ".."):
+                unlisted.append(path)
+            else:
+                by_directory[directory or "."].append((path, name))
+
+        def query_directory(item):
+            directory, items = item
+            entries = self._entries(directory)
+            if entries is None:
+                return [(path, answer_path(path)) for path, _ in items]
+            results = []
+            for path, name in items:
+                entry = entries.get(name)
+                results.append((path, missing if entry is None else answer(entry)))
+            return results
+
+        results = {path: answer_path(path) for path in unlisted}
+        if workers and len(by_directory) > 1:
+            # `os.scandir` and `os.stat` release the GIL, so directories can be listed in parallel
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for directory_results in pool.map(query_directory, by_directory.items()):
+                    results.update(directory_results)
+        else:
+            for item in by_directory.items():
+                results.update(query_directory(item))
+        return results
+
+    def exists_many(self, paths, workers=None):
+        return self._query(paths, _entry_exists, False, os.path.exists, workers)
+
+    def stat_many(self, paths, workers=None):
+        # Maps every path to its `os.stat_result`, or None if it doesn't exist
+        return self._query(paths, _entry_stat, None, _path_stat, workers)
+
+_default_cache = ScandirCache()
+
+def stat_many(paths, workers=None, cache=_default_cache):
+    return cache.stat_many(paths, workers)
+
+import tempfile
+
+work_dir = tempfile.mkdtemp()
+with open(os.path.join(work_dir, "example.txt"), "w") as file:
+    file.write("Hello, World!\n")
+
+cache = ScandirCache()
+paths = [os.path.join(work_dir, "example.txt"), os.path.join(work_dir, "missing.txt")]
+print(list(cache.exists_many(paths).values()))                # Output: [True, False]
+print([s and s.st_size for s in cache.stat_many(paths).values()])  # Output: [14, None]
+
+with open(os.path.join(work_dir, "missing.txt"), "w") as file:  # The directory mtime changes
+    file.write("Now I exist.\n")
+print(list(cache.exists_many(paths).values()))                # Output: [True, True]
+
+dangling = os.path.join(work_dir, "dangling.txt")
+os.symlink(os.path.join(work_dir, "nowhere.txt"), dangling)
+print(cache.exists_many([dangling])[dangling], cache.stat_many([dangling])[dangling])  # Output: False None
+print(list(cache.exists_many(["/", work_dir + os.sep]).values()))  # Output: [True, True]
+
+# 4. Benchmark
+# We create a few directories with many files, then ask for the existence and the size of every file
+# and of as many missing files. The scandir versions are measured cold (empty cache), warm, and with a thread pool.
+
+import shutil
+import time
+
+def benchmark_stat(directories=4, files_per_directory=20_000):
+    root = tempfile.mkdtemp()
+    paths = []
+    for d in range(directories):
+        directory = os.path.join(root, f"dir_{d}")
+        os.mkdir(directory)
+        for f in range(files_per_directory):
+            path = os.path.join(directory, f"file_{f}.dat")
+            with open(path, "wb") as file:
+                file.write(b"x" * (f % 100))
+            paths.append(path)
+            paths.append(os.path.join(directory, f"missing_{f}.dat"))
+
+    def one_by_one():
+        return {path: os.stat(path).st_size if os.path.exists(path) else None for path in paths}
+
+    cache = ScandirCache()
+    candidates = {
+        "os.path.exists + os.stat": one_by_one,
+        "exists_many (cold)": lambda: (cache.invalidate(), cache.exists_many(paths)),
+        "exists_many (warm)": lambda: cache.exists_many(paths),
+        "stat_many (cold)": lambda: (cache.invalidate(), cache.stat_many(paths)),
+        "stat_many (warm)": lambda: cache.stat_many(paths),
+        "stat_many (4 threads)": lambda: (cache.invalidate(), cache.stat_many(paths, workers=4)),
+    }
+    for name, func in candidates.items():
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<26} {len(paths) / elapsed / 1000:8.0f} k paths/s")
+    shutil.rmtree(root)
+
+benchmark_stat()
+# Output (numbers depend on your machine and file system):
+# os.path.exists + os.stat        ~200 k paths/s
+# exists_many (cold)              ~450 k paths/s
+# exists_many (warm)              ~600 k paths/s
+# stat_many (cold)                ~250 k paths/s
+# stat_many (warm)                ~600 k paths/s
+# stat_many (4 threads)           ~250 k paths/s
+# Threads help most on network file systems, where each system call waits for the server.
@@ -0,0 +1,225 @@
+# 1. The cost of one object per vector
+# The `Vector` of the dunder methods part creates a new Python object for every `+`, `-` and unary `-`.
+# Updating millions of vectors per tick means millions of allocations and method calls.
+# Note: `__abs__` should return the norm (a number), not a new vector: `math.hypot` computes it.
+
+import math
+
+class Vector:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar):
+        return Vector(self.x * scalar, self.y * scalar)
+
+    def __neg__(self):
+        return Vector(-self.x, -self.y)
+
+    def __abs__(self):
+        return math.hypot(self.x, self.y)
+
+    def __repr__(self):
+        return f"Vector({self.x}, {self.y})"
+
+print(abs(Vector(3, -4)))  # Output: 5.0
+
+# 2. Contiguous float64 columns
+# `VectorArray` stores a whole batch of 2-D vectors in two contiguous float64 buffers: one for `x`, one for `y`.
+# An operator then works on the whole batch at once ("vectorization"):
+# - With NumPy, the loops run in C and in-place operators write into the existing buffers (`out=`): no allocation.
+# - Without NumPy, `array('d')` stores the data and `map(operator.add, ...)` does the loops. In-place operators
+#   keep the same buffers, but still build one temporary array per column.
+
+import itertools
+import operator
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _column(values):
+    return np.array(values, dtype=np.float64) if np is not None else array("d", values)
+
+def _is_column(values):
+    # Only one-dimensional float64 buffers are used as they are: anything else is converted (copied) by `_column`
+    if np is None:
+        return isinstance(values, array) and values.typecode == "d"
+    return isinstance(values, np.ndarray) and values.dtype == np.float64 and values.ndim == 1
+
+def _apply(op, left, right):
+    # `right` is a column of the same length or a number
+    if np is not None:
+        return op(left, right)
+    if isinstance(right, array):
+        return array("d", map(op, left, right))
+    return array("d", map(op, left, itertools.repeat(right, len(left))))
+
+_NUMPY_UFUNCS = {operator.add: "add", operator.sub: "subtract", operator.mul: "multiply"}
+
+def _apply_inplace(op, column, right):
+    if np is not None:
+        getattr(np, _NUMPY_UFUNCS[op])(column, right, out=column)
+    else:
+        column[:] = _apply(op, column, right)
+
+class VectorArray:
+    def __init__(self, xs, ys):
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length.")
+        self.xs = xs if _is_column(xs) else _column(xs)
+        self.ys = ys if _is_column(ys) else _column(ys)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        vectors = list(vectors)
+        return cls(_column([v.x for v in vectors]), _column([v.y for v in vectors]))
+
+    @classmethod
+    def zeros(cls, size):
+        return cls(_column([0.0] * size), _column([0.0] * size))
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        return Vector(float(self.xs[index]), float(self.ys[index]))
+
+    def __iter__(self):
+        for x, y in zip(self.xs, self.ys):
+            yield Vector(float(x), float(y))
+
+    def _operands(self, other):
+        # Another batch of the same length, or one `Vector` applied to every element (broadcasting)
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray lengths differ.")
+            return other.xs, other.ys
+        if isinstance(other, Vector):
+            return other.x, other.y
+        return None
+
+    def _binary(self, op, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return VectorArray(_apply(op, self.xs, operands[0]), _apply(op, self.ys, operands[1]))
+
+    def _inplace(self, op, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        _apply_inplace(op, self.xs, operands[0])
+        _apply_inplace(op, self.ys, operands[1])
+        return self
+
+    def __add__(self, other):
+        return self._binary(operator.add, other)
+
+    def __sub__(self, other):
+        return self._binary(operator.sub, other)
+
+    def __iadd__(self, other):
+        return self._inplace(operator.add, other)
+
+    def __isub__(self, other):
+        return self._inplace(operator.sub, other)
+
+    def __mul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        return VectorArray(_apply(operator.mul, self.xs, scalar), _apply(operator.mul, self.ys, scalar))
+
+    __rmul__ = __mul__
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        _apply_inplace(operator.mul, self.xs, scalar)
+        _apply_inplace(operator.mul, self.ys, scalar)
+        return self
+
+    def __neg__(self):
+        return self * -1.0
+
+    # 3. Norms and dot products
+    # `norms()` returns the length of every vector and `dot(other)` the dot product of each pair, as a float64 column.
+    def norms(self):
+        if np is not None:
+            return np.hypot(self.xs, self.ys)
+        return array("d", map(math.hypot, self.xs, self.ys))
+
+    def dot(self, other):
+        other_xs, other_ys = self._operands(other)
+        if np is not None:
+            return self.xs * other_xs + self.ys * other_ys
+        return _apply(operator.add, _apply(operator.mul, self.xs, other_xs), _apply(operator.mul, self.ys, other_ys))
+
+    def __repr__(self):
+        return f"VectorArray({list(self)!r})"
+
+positions = VectorArray.from_vectors([Vector(0, 0), Vector(1, 1), Vector(3, 4)])
+velocities = VectorArray([1, 0, -1], [0, 1, -1])
+buffer_before = positions.xs
+positions += velocities * 0.5
+print(positions)                      # Output: VectorArray([Vector(0.5, 0.0), Vector(1.0, 1.5), Vector(2.5, 3.5)])
+print(positions.xs is buffer_before)  # Output: True (updated in place)
+print(VectorArray([3], [4]).norms().tolist())            # Output: [5.0]
+print(positions.dot(Vector(1, 0)).tolist())              # Output: [0.5, 1.0, 2.5]
+counts = VectorArray(array("i", [1, 2]), array("i", [3, 4]))  # int32 columns are converted to float64
+counts += Vector(0.5, 0.5)
+print(counts)                         # Output: VectorArray([Vector(1.5, 3.5), Vector(2.5, 4.5)])
+
+# 4. Benchmark
+# One physics tick: `position = position + velocity * dt` for every object.
+# We compare a list of `Vector` objects with `VectorArray` (new arrays, and in place).
+
+import random
+import time
+
+def benchmark_vectors(count=200_000, ticks=5, dt=0.01):
+    rng = random.Random(0)
+    points = [Vector(rng.random(), rng.random()) for _ in range(count)]
+    speeds = [Vector(rng.random(), rng.random()) for _ in range(count)]
+    batch_points = VectorArray.from_vectors(points)
+    batch_speeds = VectorArray.from_vectors(speeds)
+
+    def list_of_vectors():
+        nonlocal points
+        for _ in range(ticks):
+            points = [p + v * dt for p, v in zip(points, speeds)]
+
+    def vector_array():
+        nonlocal batch_points
+        for _ in range(ticks):
+            batch_points = batch_points + batch_speeds * dt
+
+    def vector_array_inplace():
+        nonlocal batch_points
+        scaled = batch_speeds * dt
+        for _ in range(ticks):
+            batch_points += scaled
+
+    print(f"backend: {'numpy' if np is not None else 'array.array'}")
+    for name, func in (("list of Vector", list_of_vectors), ("VectorArray", vector_array),
+                       ("VectorArray +=", vector_array_inplace)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {count * ticks / elapsed / 1e6:8.2f} M vector updates/s")
+
+benchmark_vectors()
+# Output without NumPy (numbers depend on your machine):
+# backend: array.array
+# list of Vector     ~0.7 M vector updates/s
+# VectorArray        ~2.5 M vector updates/s
+# VectorArray +=     ~4.5 M vector updates/s
+# With NumPy, `VectorArray` reaches several hundred M vector updates/s.
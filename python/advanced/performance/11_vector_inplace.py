@@ -0,0 +1,192 @@
+# 1. `v += w` without `__iadd__`
+# The dunder methods part lists `__iadd__`, `__isub__` and `__imul__` without implementing them.
+# When `__iadd__` is missing, Python falls back to `v = v + w`: a new object is created on every `+=`.
+
+class Vector:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar):
+        return Vector(self.x * scalar, self.y * scalar)
+
+    def __str__(self):
+        return f"Vector({self.x}, {self.y})"
+
+v = Vector(1, 2)
+before = id(v)
+v += Vector(3, 4)
+print(v, id(v) == before)  # Output: Vector(4, 6) False (a new object)
+
+# 2. Real in-place operators and `__slots__`
+# In-place operators modify `self` and must return it: Python assigns the returned value back to the variable.
+# `__slots__` removes the per-instance `__dict__`, so each vector is smaller and attribute access is a bit faster.
+# Returning `NotImplemented` lets Python try the other operand or raise a `TypeError`.
+
+class SlottedVector:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return SlottedVector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return SlottedVector(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar):
+        return SlottedVector(self.x * scalar, self.y * scalar)
+
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __itruediv__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def set(self, x, y):
+        self.x = x
+        self.y = y
+        return self
+
+    def __str__(self):
+        return f"Vector({self.x}, {self.y})"
+
+v = SlottedVector(1, 2)
+before = id(v)
+v += SlottedVector(3, 4)
+v *= 2
+print(v, id(v) == before)  # Output: Vector(8, 12) True (the same object)
+
+# 3. An object pool for temporary vectors
+# Expressions like `position += velocity * dt` create a temporary vector for `velocity * dt`.
+# A pool keeps released vectors in a "free list" and hands them out again instead of creating new ones.
+# The pool is bounded so it can't grow forever, and a context manager makes sure the vector is given back.
+# Warning: a released vector must not be used anymore, as it can be handed out again at any time.
+
+from contextlib import contextmanager
+
+class VectorPool:
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._free = []
+
+    def acquire(self, x=0.0, y=0.0):
+        if self._free:
+            return self._free.pop().set(x, y)
+        return SlottedVector(x, y)
+
+    def release(self, vector):
+        if len(self._free) < self.max_size:
+            self._free.append(vector)
+
+    @contextmanager
+    def temporary(self, x=0.0, y=0.0):
+        vector = self.acquire(x, y)
+        try:
+            yield vector
+        finally:
+            self.release(vector)
+
+pool = VectorPool()
+position = SlottedVector(0.0, 0.0)
+velocity = SlottedVector(1.0, 2.0)
+with pool.temporary(velocity.x, velocity.y) as step:
+    step *= 0.5
+    position += step
+print(position)  # Output: Vector(0.5, 1.0)
+
+# 4. Measuring allocations
+# - `sys.getallocatedblocks()` returns the number of memory blocks currently allocated by the interpreter.
+# - `tracemalloc` traces the memory allocated by Python code.
+# Both show memory that is still alive, so to count the objects an operation creates, we keep a reference
+# to each result in a list allocated beforehand. An in-place operation returns the same object every time,
+# so it adds nothing; `v = v + w` adds a new vector and its two floats per operation
+# (plus the storage of its attributes when the class has no `__slots__`).
+
+import sys
+import time
+import tracemalloc
+
+def _allocations_per_op(step, count):
+    results = [None] * count  # Allocated before measuring
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    for i in range(count):
+        results[i] = step()
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    return blocks / count, traced / count
+
+def benchmark_vector_ops(count=200_000):
+    w = SlottedVector(0.5, 0.25)
+    plain = Vector(0.0, 0.0)
+    slotted = SlottedVector(0.0, 0.0)
+    pool = VectorPool()
+
+    def add_plain():
+        nonlocal plain
+        plain += Vector(0.5, 0.25)  # No __iadd__: new object
+        return plain
+
+    def add_slotted():
+        nonlocal slotted
+        slotted = slotted + w * 0.5  # Temporary vector and a new result
+        return slotted
+
+    def iadd_slotted():
+        nonlocal slotted
+        slotted += w
+        return slotted
+
+    def iadd_pooled():
+        nonlocal slotted
+        step = pool.acquire(w.x, w.y)
+        step *= 0.5
+        slotted += step
+        pool.release(step)
+        return slotted
+
+    for name, step in (("v = v + w (dict)", add_plain), ("v = v + w * dt", add_slotted),
+                       ("v += w", iadd_slotted), ("v += pooled tmp", iadd_pooled)):
+        blocks, traced = _allocations_per_op(step, count)
+        start = time.perf_counter()
+        for _ in range(count):
+            step()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<18} {blocks:5.2f} blocks/op {traced:7.1f} bytes/op {elapsed / count * 1e9:7.1f} ns/op")
+
+benchmark_vector_ops()
+# Output (numbers depend on your machine and Python version):
+# v = v + w (dict)    4.00 blocks/op   136.0 bytes/op   ~480 ns/op
+# v = v + w * dt      3.00 blocks/op    96.0 bytes/op   ~500 ns/op
+# v += w              0.00 blocks/op     0.0 bytes/op   ~130 ns/op
+# v += pooled tmp     0.00 blocks/op     0.0 bytes/op   ~480 ns/op
+# The pool removes the allocations, but in CPython creating a small object is already cheap (free lists
+# and the pymalloc allocator), so the extra method calls make it slower: measure before using a pool.
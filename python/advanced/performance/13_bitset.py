@@ -0,0 +1,232 @@
+# 1. From `BitwiseExample` to a bit set
+# `BitwiseExample` of the dunder methods part wraps one integer and supports `&` and `|`.
+# A Python `int` has no size limit, so one integer can hold millions of bits: bit `i` is set when user `i` has the flag.
+# Bitwise operators on big integers run in C on whole machine words (64 bits at a time),
+# which is much faster than a `set[int]` that stores one object per element.
+
+class BitwiseExample:
+    def __init__(self, value):
+        self.value = value
+
+    def __and__(self, other):
+        return BitwiseExample(self.value & other.value)
+
+    def __or__(self, other):
+        return BitwiseExample(self.value | other.value)
+
+    def __str__(self):
+        return f"Value: {self.value}"
+
+print(BitwiseExample(12) & BitwiseExample(6))  # Output: Value: 4
+
+# 2. `BitSet`
+# `BitSet` keeps the same operator API and adds:
+# - a fixed `size`, so `~` (complement) and `<<` stay within the `size` bits (a mask removes the extra bits),
+# - `^`, `~`, `<<`, `>>` and in-place variants (`&=`, `|=`, `^=`, `<<=`, `>>=`),
+# - `len()` with `int.bit_count()` (Python 3.10+), which counts the set bits in C ("popcount").
+# Python integers are immutable, so in-place operators replace the integer inside the same `BitSet` object.
+
+import sys
+from array import array
+
+class BitSet:
+    __slots__ = ("size", "_bits")
+
+    def __init__(self, size, bits=0):
+        self.size = size
+        self._bits = bits & ((1 << size) - 1)
+
+    @classmethod
+    def from_indices(cls, indices, size):
+        buffer = bytearray((size + 7) // 8)
+        for index in indices:
+            if not 0 <= index < size:
+                raise IndexError(f"Bit index {index} out of range for size {size}.")
+            buffer[index >> 3] |= 1 << (index & 7)
+        return cls(size, int.from_bytes(buffer, "little"))
+
+    def _check(self, other):
+        if not isinstance(other, BitSet):
+            return False
+        if other.size != self.size:
+            raise ValueError("BitSet sizes differ.")
+        return True
+
+    def __and__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return BitSet(self.size, self._bits & other._bits)
+
+    def __or__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return BitSet(self.size, self._bits | other._bits)
+
+    def __xor__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return BitSet(self.size, self._bits ^ other._bits)
+
+    def __invert__(self):
+        return BitSet(self.size, ~self._bits)  # The mask in `__init__` keeps only `size` bits
+
+    def __lshift__(self, count):
+        return BitSet(self.size, self._bits << count)
+
+    def __rshift__(self, count):
+        return BitSet(self.size, self._bits >> count)
+
+    def __iand__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        self._bits &= other._bits
+        return self
+
+    def __ior__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        self._bits |= other._bits
+        return self
+
+    def __ixor__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        self._bits ^= other._bits
+        return self
+
+    def __ilshift__(self, count):
+        self._bits = (self._bits << count) & ((1 << self.size) - 1)
+        return self
+
+    def __irshift__(self, count):
+        self._bits >>= count
+        return self
+
+    def __len__(self):
+        return self._bits.bit_count()
+
+    def __contains__(self, index):
+        return 0 <= index < self.size and (self._bits >> index) & 1 == 1
+
+    def __eq__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self.size == other.size and self._bits == other._bits
+
+    # 3. Iterating over set bits
+    # The bits are converted to little-endian bytes once, then read as 64-bit words in an `array("Q")`
+    # (swapped on big-endian machines, where the words are read the other way round).
+    # Zero words are skipped with a single comparison, and in a non-zero word `word & -word` isolates the lowest set bit.
+    def __iter__(self):
+        data = self.to_bytes()
+        data += bytes(-len(data) % 8)  # Pad to a multiple of 8 bytes
+        words = array("Q")
+        words.frombytes(data)
+        if sys.byteorder == "big":
+            words.byteswap()
+        for word_index, word in enumerate(words):
+            base = word_index * 64
+            while word:
+                lowest = word & -word
+                yield base + lowest.bit_length() - 1
+                word ^= lowest
+
+    # 4. Serialization
+    # `to_bytes` gives `ceil(size / 8)` little-endian bytes: bit `i` is bit `i % 8` of byte `i // 8`.
+    def to_bytes(self):
+        return self._bits.to_bytes((self.size + 7) // 8, "little")
+
+    @classmethod
+    def from_bytes(cls, data, size=None):
+        return cls(len(data) * 8 if size is None else size, int.from_bytes(data, "little"))
+
+    # 5. Run-length compression for sparse sets
+    # A sparse set with long gaps is stored as (start, length) runs of set bits, in an `array('Q')`.
+    # The starts of runs are the set bits whose previous bit is not set: `bits & ~(bits << 1)`.
+    # The ends of runs are the set bits whose next bit is not set: `bits & ~(bits >> 1)`.
+    def to_runs(self):
+        starts = BitSet(self.size, self._bits & ~(self._bits << 1))
+        ends = BitSet(self.size, self._bits & ~(self._bits >> 1))
+        runs = array("Q")
+        for start, end in zip(starts, ends):
+            runs.append(start)
+            runs.append(end - start + 1)
+        return runs
+
+    @classmethod
+    def from_runs(cls, runs, size):
+        bits = 0
+        for i in range(0, len(runs), 2):
+            start, length = runs[i], runs[i + 1]
+            bits |= ((1 << length) - 1) << start
+        return cls(size, bits)
+
+    def to_compressed_bytes(self):
+        return self.to_runs().tobytes()
+
+    @classmethod
+    def from_compressed_bytes(cls, data, size):
+        runs = array("Q")
+        runs.frombytes(data)
+        return cls.from_runs(runs, size)
+
+    def __repr__(self):
+        return f"BitSet({self.size}, {list(self)})"
+
+a = BitSet.from_indices([1, 2, 3, 10], size=16)
+b = BitSet.from_indices([2, 3, 4], size=16)
+print(a & b)         # Output: BitSet(16, [2, 3])
+print(a | b)         # Output: BitSet(16, [1, 2, 3, 4, 10])
+print(a ^ b)         # Output: BitSet(16, [1, 4, 10])
+print(len(~a))       # Output: 12
+print(a << 6)        # Output: BitSet(16, [7, 8, 9])
+a |= b
+print(len(a), 10 in a)  # Output: 5 True
+
+print(a.to_bytes())                          # Output: b'\x1e\x04'
+print(BitSet.from_bytes(a.to_bytes()) == a)  # Output: True
+print(list(a.to_runs()))                     # Output: [1, 4, 10, 1]
+
+sparse = BitSet.from_indices(range(500_000, 500_100), size=1_000_000)
+print(len(sparse.to_bytes()), len(sparse.to_compressed_bytes()))  # Output: 125000 16
+print(BitSet.from_compressed_bytes(sparse.to_compressed_bytes(), 1_000_000) == sparse)  # Output: True
+
+# 6. Benchmark
+# Intersection and union of two random sets of the same density, over a universe of `size` users.
+# Building the sets is not measured.
+
+import random
+import time
+
+def _timed(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_bitset(size=1_000_000, densities=(0.001, 0.01, 0.5)):
+    rng = random.Random(0)
+    print(f"{'density':>8} {'set &':>10} {'BitSet &':>10} {'set |':>10} {'BitSet |':>10}  (ms)")
+    for density in densities:
+        first = set(rng.sample(range(size), int(size * density)))
+        second = set(rng.sample(range(size), int(size * density)))
+        first_bits = BitSet.from_indices(first, size)
+        second_bits = BitSet.from_indices(second, size)
+        results = (
+            _timed(lambda: first & second),
+            _timed(lambda: first_bits & second_bits),
+            _timed(lambda: first | second),
+            _timed(lambda: first_bits | second_bits),
+        )
+        print(f"{density:>8} " + " ".join(f"{seconds * 1000:>10.3f}" for seconds in results))
+
+benchmark_bitset()
+# Output (numbers depend on your machine):
+#  density      set &   BitSet &      set |   BitSet |  (ms)
+#    0.001      ~0.01      ~0.05      ~0.05      ~0.05
+#     0.01       ~0.3      ~0.05       ~0.9      ~0.05
+#      0.5        ~30      ~0.05        ~55      ~0.05
+# The BitSet time depends only on `size`, the set time on the number of elements:
+# for very sparse sets a `set` (or the run-length form) is the better choice.
@@ -0,0 +1,225 @@
+# 1. One object per reading
+# `Celsius` of the dunder methods part converts one temperature at a time through `__int__`, `__float__` and `__bool__`.
+# With millions of readings per minute, creating one object per reading and calling a dunder method per conversion
+# costs far more than the arithmetic itself.
+
+class Celsius:
+    def __init__(self, temperature):
+        self.temperature = temperature
+
+    def __int__(self):
+        return int(self.temperature)
+
+    def __float__(self):
+        return float(self.temperature)
+
+    def __bool__(self):
+        return self.temperature > 0
+
+temp = Celsius(37.5)
+print(int(temp), float(temp), bool(temp))  # Output: 37 37.5 True
+
+# 2. `CelsiusSeries`: readings in a float buffer
+# All readings are stored in one contiguous float64 buffer: NumPy if it is installed, `array('d')` otherwise.
+# Conversions work on the whole buffer at once:
+# - With NumPy, the loops run in C.
+# - Without NumPy, `map(operator.mul, data, repeat(1.8))` applies a C function to every element:
+#   no Python function is called per reading, and no intermediate list is built.
+# `truthy_mask()` is the batch version of `__bool__`: one byte (or NumPy bool) per reading, 1 when above 0 °C.
+
+import itertools
+import operator
+import sys
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _buffer(values=()):
+    return np.asarray(values, dtype=np.float64) if np is not None else array("d", values)
+
+def _scale_shift(data, scale, shift):
+    if np is not None:
+        return data * scale + shift
+    size = len(data)
+    scaled = map(operator.mul, data, itertools.repeat(scale, size)) if scale != 1 else data
+    return array("d", map(operator.add, scaled, itertools.repeat(shift, size)))
+
+class CelsiusSeries:
+    def __init__(self, readings=()):
+        self.data = _buffer(readings)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return Celsius(float(self.data[index]))
+
+    def to_fahrenheit(self):
+        return _scale_shift(self.data, 1.8, 32.0)
+
+    def to_kelvin(self):
+        return _scale_shift(self.data, 1, 273.15)
+
+    def to_int(self):
+        if np is not None:
+            return self.data.astype(np.int64)  # Truncates toward zero, like `int()`
+        return array("q", map(int, self.data))
+
+    def round(self, ndigits=0):
+        if np is not None:
+            return np.round(self.data, ndigits)
+        return array("d", map(round, self.data, itertools.repeat(ndigits, len(self.data))))
+
+    def truthy_mask(self):
+        if np is not None:
+            return self.data > 0
+        return bytes(map(operator.gt, self.data, itertools.repeat(0.0, len(self.data))))
+
+    # 3. Streaming ingest
+    # - `extend_from_csv` reads an iterable of CSV lines (a file object works) in batches of float64 values
+    #   (8 bytes per reading instead of a string per line), and appends them all at once at the end.
+    #   Splitting lines with `str.split` is faster than the `csv` module for simple numeric files without quotes.
+    # - `extend_from_bytes` appends raw little-endian float64 values, the fastest format to exchange readings.
+    def extend_from_csv(self, lines, column=0, delimiter=",", skip_header=False, batch_size=65_536):
+        lines = iter(lines)
+        if skip_header:
+            next(lines, None)
+        batches = []
+        while True:
+            batch = list(itertools.islice(lines, batch_size))
+            if not batch:
+                break
+            batches.append(array("d", [float(line.split(delimiter)[column]) for line in batch]))
+        self._append(*batches)
+        return self
+
+    def extend_from_bytes(self, data):
+        values = array("d")
+        values.frombytes(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        self._append(values)
+        return self
+
+    def to_bytes(self):
+        values = array("d", self.data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tobytes()
+
+    def _append(self, *batches):
+        # One `np.concatenate` for all the batches: concatenating each batch would copy the whole buffer every time
+        if np is not None:
+            if batches:
+                arrays = [np.frombuffer(values, dtype=np.float64) for values in batches]
+                self.data = np.concatenate([self.data, *arrays])
+        else:
+            for values in batches:
+                self.data.extend(values)
+
+    # 4. Rolling windows
+    # Recomputing min/max over a window of `w` readings at each position costs O(n * w).
+    # A monotonic deque keeps only the indices that can still become the minimum (or maximum):
+    # every index is added and removed once, so the whole pass is O(n).
+    # The rolling mean keeps a running sum: add the new reading, subtract the one leaving the window.
+    # Each function returns one value per complete window (`len(series) - window + 1` values).
+    def rolling_min(self, window):
+        return _rolling_extreme(self.data, window, operator.ge)
+
+    def rolling_max(self, window):
+        return _rolling_extreme(self.data, window, operator.le)
+
+    def rolling_mean(self, window):
+        _check_window(window, len(self.data))
+        if np is not None:
+            sums = np.cumsum(np.concatenate(([0.0], self.data)))
+            return (sums[window:] - sums[:-window]) / window
+        result = array("d")
+        data = self.data
+        total = sum(data[:window])
+        result.append(total / window)
+        for i in range(window, len(data)):
+            total += data[i] - data[i - window]
+            result.append(total / window)
+        return result
+
+def _check_window(window, size):
+    if not 1 <= window <= size:
+        raise ValueError("window must be between 1 and the number of readings.")
+
+def _rolling_extreme(data, window, drop):
+    # `drop(last, new)` is True when `last` can never be the extreme again once `new` is in the window
+    _check_window(window, len(data))
+    result = array("d")
+    candidates = deque()
+    for i, value in enumerate(data):
+        while candidates and drop(data[candidates[-1]], value):
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            result.append(data[candidates[0]])
+    return result
+
+series = CelsiusSeries([-5.0, 0.0, 12.5, 37.5, 20.0])
+print(list(series.to_fahrenheit()))  # Output: [23.0, 32.0, 54.5, 99.5, 68.0]
+print(list(series.to_kelvin()))      # Output: [268.15, 273.15, 285.65, 310.65, 293.15]
+print(list(series.to_int()))         # Output: [-5, 0, 12, 37, 20]
+print(list(series.truthy_mask()))    # Output: [0, 0, 1, 1, 1]
+print(list(series.rolling_min(3)), list(series.rolling_max(3)), list(series.rolling_mean(2)))
+# Output: [-5.0, 0.0, 12.5] [12.5, 37.5, 37.5] [-2.5, 6.25, 25.0, 28.75]
+
+stream = CelsiusSeries().extend_from_csv(["time,temperature", "12:00,21.5", "12:01,22.0"], column=1, skip_header=True)
+stream.extend_from_bytes(CelsiusSeries([23.5]).to_bytes())
+print(list(stream.data))  # Output: [21.5, 22.0, 23.5]
+
+# 5. Benchmark
+# Throughput of the conversions and of the ingest, compared with a list of `Celsius` objects.
+
+import random
+import time
+
+def _rate(func, count):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start) / 1e6
+
+def benchmark_celsius(count=1_000_000):
+    rng = random.Random(0)
+    readings = [rng.uniform(-30, 45) for _ in range(count)]
+    objects = [Celsius(value) for value in readings]
+    series = CelsiusSeries(readings)
+    lines = [f"{i},{value:.2f}" for i, value in enumerate(readings)]
+
+    results = {
+        "ingest list of Celsius (CSV)": _rate(lambda: [Celsius(float(line.split(",")[1])) for line in lines], count),
+        "ingest CelsiusSeries (CSV)": _rate(lambda: CelsiusSeries().extend_from_csv(lines, column=1), count),
+        "Fahrenheit, list of Celsius": _rate(lambda: [float(c) * 1.8 + 32 for c in objects], count),
+        "Fahrenheit, CelsiusSeries": _rate(series.to_fahrenheit, count),
+        "bool(), list of Celsius": _rate(lambda: [bool(c) for c in objects], count),
+        "truthy_mask, CelsiusSeries": _rate(series.truthy_mask, count),
+        "rolling mean (60)": _rate(lambda: series.rolling_mean(60), count),
+        "rolling max (60)": _rate(lambda: series.rolling_max(60), count),
+    }
+    print(f"backend: {'numpy' if np is not None else 'array.array'}")
+    for name, rate in results.items():
+        print(f"{name:<30} {rate:8.1f} M readings/s")
+
+benchmark_celsius()
+# Output without NumPy (numbers depend on your machine):
+# backend: array.array
+# ingest list of Celsius (CSV)        ~1 M readings/s
+# ingest CelsiusSeries (CSV)          ~4 M readings/s
+# Fahrenheit, list of Celsius         ~8 M readings/s
+# Fahrenheit, CelsiusSeries           ~9 M readings/s
+# bool(), list of Celsius             ~8 M readings/s
+# truthy_mask, CelsiusSeries         ~20 M readings/s
+# rolling mean (60)                   ~4 M readings/s
+# rolling max (60)                  ~1.5 M readings/s
+# The series also uses 8 bytes per reading instead of ~56 for a `Celsius` object and its float.
+# With NumPy installed, conversions and rolling means reach hundreds of M readings/s.
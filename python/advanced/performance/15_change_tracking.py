@@ -0,0 +1,251 @@
+# 1. Printing on every assignment
+# The `Person` of the attribute access section prints in `__setattr__` and `__delattr__`, so every assignment
+# (including the ones in `__init__`) formats a string and writes to the terminal.
+# Its `__getattr__` also returns a string for any missing attribute: a typo like `person.agee` silently gives
+# "agee not found." instead of raising an `AttributeError`, which hides bugs.
+
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def __getattr__(self, attr):
+        return f"{attr} not found."
+
+    def __setattr__(self, name, value):
+        print(f"Setting {name} to {value}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        print(f"Deleting {name}")
+        super().__delattr__(name)
+
+person = Person("Alice", 30)
+# Output:
+# Setting name to Alice
+# Setting age to 30
+print(person.agee)            # Output: agee not found. (a typo that goes unnoticed)
+
+# 2. A bounded change log
+# Instead of printing, each change is stored as a tuple `(object id, attribute, old value, new value)`.
+# `ChangeLog` keeps the records in a `deque` with a `maxlen`: a ring buffer, so when it is full the oldest
+# records are dropped and memory stays bounded. Appending to a deque runs in C and creates no string.
+# With a `sink` (any function that takes a list of records, for example a file writer or a queue),
+# the records are flushed in batches of `batch_size`: one sink call per batch instead of one per change.
+# A deleted attribute is recorded with `MISSING` as its new value, a new attribute with `MISSING` as its old value.
+
+from collections import deque
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+MISSING = _Missing()
+
+class ChangeLog:
+    def __init__(self, capacity=65_536, sink=None, batch_size=4096):
+        if not 1 <= batch_size <= capacity:
+            raise ValueError("batch_size must be between 1 and capacity.")
+        self.sink = sink
+        self.batch_size = batch_size
+        self._records = deque(maxlen=capacity)
+
+    def record(self, obj, name, old, new):
+        records = self._records
+        records.append((id(obj), name, old, new))
+        if self.sink is not None and len(records) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        batch = list(self._records)
+        self._records.clear()
+        if batch and self.sink is not None:
+            self.sink(batch)
+        return batch
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+# 3. The `ChangeTracking` mixin
+# A `__setattr__` method defined in Python makes every assignment slower, even when it does nothing.
+# To switch tracking off with zero overhead, the mixin doesn't define `__setattr__` itself: `set_tracking(True)`
+# installs tracking functions on the class, and `set_tracking(False)` removes them, so assignments go straight
+# to `object.__setattr__` in C again. If a parent class is still tracked, the class gets `object.__setattr__`
+# and `object.__delattr__` explicitly, which CPython also maps to the C implementation.
+# A class can still define its own `__setattr__` or `__delattr__` (to validate values, for example):
+# `__init_subclass__` remembers the hook the class would use without tracking, the tracking functions call it
+# instead of `object.__setattr__`, and `set_tracking(False)` puts it back.
+# Options are passed in the class statement and read by `__init_subclass__`:
+#     class Account(ChangeTracking, change_log=log, track=False): ...
+# The mixin has no `__getattr__`: a missing attribute raises `AttributeError` as usual.
+
+def _tracked_hooks(untracked_setattr, untracked_delattr):
+    def tracked_setattr(self, name, value):
+        old = getattr(self, name, MISSING)
+        untracked_setattr(self, name, value)
+        self.change_log.record(self, name, old, value)
+
+    def tracked_delattr(self, name):
+        old = getattr(self, name, MISSING)
+        untracked_delattr(self, name)
+        self.change_log.record(self, name, old, MISSING)
+
+    tracked_setattr.tracks_changes = tracked_delattr.tracks_changes = True
+    return {"__setattr__": tracked_setattr, "__delattr__": tracked_delattr}
+
+class ChangeTracking:
+    change_log = None
+
+    def __init_subclass__(cls, change_log=None, track=True, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if change_log is not None:
+            cls.change_log = change_log
+        elif cls.change_log is None:
+            cls.change_log = ChangeLog()
+        cls._untracked = {name: cls._untracked_hook(name) for name in ("__setattr__", "__delattr__")}
+        cls._tracked = _tracked_hooks(cls._untracked["__setattr__"], cls._untracked["__delattr__"])
+        cls.set_tracking(track)
+
+    @classmethod
+    def _untracked_hook(cls, name):
+        # The class's own hook, or the one it inherits, without the tracking functions of its parents
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                if klass is not cls and "_untracked" in klass.__dict__:
+                    return klass._untracked[name]
+                return klass.__dict__[name]
+
+    @classmethod
+    def set_tracking(cls, enabled):
+        hooks = cls._tracked if enabled else cls._untracked
+        for name, hook in hooks.items():
+            if name in cls.__dict__:
+                delattr(cls, name)
+            if getattr(cls, name) is not hook:
+                setattr(cls, name, hook)
+
+    @classmethod
+    def is_tracking(cls):
+        return getattr(cls.__setattr__, "tracks_changes", False)
+
+class TrackedPerson(ChangeTracking):
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+tracked = TrackedPerson("Alice", 30)
+tracked.age = 31
+del tracked.name
+for _, name, old, new in TrackedPerson.change_log:
+    print(name, old, new)
+# Output:
+# name MISSING Alice
+# age MISSING 30
+# age 30 31
+# name Alice MISSING
+
+try:
+    tracked.agee
+except AttributeError as e:
+    print(e)  # Output: 'TrackedPerson' object has no attribute 'agee'
+
+TrackedPerson.set_tracking(False)
+tracked.age = 32
+print(TrackedPerson.is_tracking(), len(TrackedPerson.change_log))  # Output: False 4
+
+# A class's own `__setattr__` keeps running, with or without tracking.
+class ValidatedPerson(ChangeTracking):
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def __setattr__(self, name, value):
+        if name == "age" and value < 0:
+            raise ValueError("age must be non-negative.")
+        super().__setattr__(name, value)
+
+validated = ValidatedPerson("Bob", 40)
+for enabled in (True, False):
+    ValidatedPerson.set_tracking(enabled)
+    try:
+        validated.age = -1
+    except ValueError as e:
+        print(e, validated.age, len(ValidatedPerson.change_log))
+# Output:
+# age must be non-negative. 40 2
+# age must be non-negative. 40 2
+
+# A sink receives the records in batches, and `flush()` sends the last, incomplete batch.
+batches = []
+
+class Sensor(ChangeTracking, change_log=ChangeLog(capacity=8, sink=batches.append, batch_size=3)):
+    def __init__(self, value):
+        self.value = value
+
+sensor = Sensor(0)
+for value in range(1, 5):
+    sensor.value = value
+Sensor.change_log.flush()
+print([len(batch) for batch in batches])  # Output: [3, 2]
+
+# 4. Benchmark
+# Cost of one `obj.age = i` assignment:
+# - the original `Person`, with `print` redirected to memory so the terminal is not measured,
+# - a plain class without `__setattr__`,
+# - `ChangeTracking` switched off, switched on (ring buffer only), and switched on with a batching sink.
+
+import contextlib
+import io
+import time
+
+class PlainPerson:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+class OffPerson(ChangeTracking, track=False):
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+class OnPerson(ChangeTracking):
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+class SinkPerson(ChangeTracking, change_log=ChangeLog(sink=lambda batch: None)):
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+def _ns_per_assignment(obj, count):
+    start = time.perf_counter()
+    for i in range(count):
+        obj.age = i
+    return (time.perf_counter() - start) / count * 1e9
+
+def benchmark_setattr(count=1_000_000):
+    with contextlib.redirect_stdout(io.StringIO()):
+        original = _ns_per_assignment(Person("Alice", 30), count // 10)
+    results = {
+        "Person (print)": original,
+        "plain class": _ns_per_assignment(PlainPerson("Alice", 30), count),
+        "tracking off": _ns_per_assignment(OffPerson("Alice", 30), count),
+        "tracking on": _ns_per_assignment(OnPerson("Alice", 30), count),
+        "tracking on + sink": _ns_per_assignment(SinkPerson("Alice", 30), count),
+    }
+    for name, ns in results.items():
+        print(f"{name:<20} {ns:8.1f} ns/assignment")
+
+benchmark_setattr()
+# Output (numbers depend on your machine):
+# Person (print)           ~1100 ns/assignment
+# plain class                ~25 ns/assignment
+# tracking off               ~25 ns/assignment
+# tracking on               ~450 ns/assignment
+# tracking on + sink        ~500 ns/assignment
+# Switched off, a tracked class is as fast as a plain class. Switched on, tracking is still several times
+# cheaper than printing, and the ring buffer keeps its memory bounded.
@@ -0,0 +1,187 @@
+# 1. One call per value
+# `Multiplier` of the callable objects section scales one value per call.
+# Scaling an array of millions of values this way means millions of `__call__` calls, each one creating a new
+# Python number, and a pipeline of several scaling steps repeats all of this once per step.
+
+class Multiplier:
+    def __init__(self, factor):
+        self.factor = factor
+
+    def __call__(self, value):
+        return value * self.factor
+
+double = Multiplier(2)
+print(double(5))                # Output: 10
+print(Multiplier(2) is double)  # Output: False (a new object for the same factor)
+
+# 2. Batch scaling
+# `map_batch(buffer)` scales a whole `array.array`, `memoryview` (or NumPy array) in one step:
+# - With NumPy, `np.multiply` runs the loop in C, and `out=` writes into an existing buffer.
+# - Without NumPy, `map(operator.mul, view, repeat(factor))` calls a C function per element, with no Python-level
+#   call, and `array(typecode, ...)` fills the result without building a list first.
+# The result keeps integer values (int64) when both the buffer and the factor are integers, and is float64 otherwise.
+# Both versions check the input first (one-dimensional buffers, `out` of the same length), and raise the same
+# `OverflowError` when an integer result doesn't fit in int64. NumPy integers wrap around silently on overflow,
+# so the NumPy version checks the products of the smallest and largest values before multiplying.
+#
+# 3. Composition
+# Scaling by 2 then by 3 is scaling by 6: `CachedMultiplier(2) @ CachedMultiplier(3)` returns `CachedMultiplier(6)`,
+# so a pipeline of scaling steps becomes a single pass over the data.
+#
+# 4. A registry of multipliers
+# `__new__` looks the factor up in a registry before creating a new object, so `CachedMultiplier(2) is CachedMultiplier(2)`.
+# - The registry is a `WeakValueDictionary`: a multiplier that is no longer used anywhere is removed from it.
+# - The key includes the type of the factor, because `2 == 2.0 == True` but they give results of different types.
+# - A shared object must not change, so the class is immutable (`__setattr__` raises an error).
+# - `copy`, `deepcopy` and `pickle` would need `__new__` without arguments and `__setattr__`: `__reduce__` tells
+#   them to call `CachedMultiplier(factor)` instead, which also goes through the registry.
+
+import itertools
+import operator
+import weakref
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FLOAT_FORMATS = {"f", "d"}
+INT64_LIMIT = 2 ** 63
+INT64_OVERFLOW = "The result does not fit in a signed 64-bit integer."
+
+def _as_memoryview(data):
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if view.ndim != 1:
+        raise ValueError("Only one-dimensional buffers are supported.")
+    return view
+
+def _check_int64_product(source, factor):
+    if len(source):
+        for value in (int(source.min()), int(source.max())):
+            if not -INT64_LIMIT <= value * factor < INT64_LIMIT:
+                raise OverflowError(INT64_OVERFLOW)
+
+class CachedMultiplier:
+    __slots__ = ("factor", "__weakref__")
+    _registry = weakref.WeakValueDictionary()
+
+    def __new__(cls, factor):
+        key = (type(factor), factor)
+        multiplier = cls._registry.get(key)
+        if multiplier is None:
+            multiplier = super().__new__(cls)
+            object.__setattr__(multiplier, "factor", factor)
+            cls._registry[key] = multiplier
+        return multiplier
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self):
+        return type(self), (self.factor,)
+
+    def __call__(self, value):
+        return value * self.factor
+
+    def __matmul__(self, other):
+        if not isinstance(other, CachedMultiplier):
+            return NotImplemented
+        return CachedMultiplier(self.factor * other.factor)
+
+    def map_batch(self, buffer, out=None):
+        factor = self.factor
+        view = _as_memoryview(buffer)
+        out_view = None if out is None else _as_memoryview(out)
+        if out_view is not None and len(out_view) != len(view):
+            raise ValueError("out must have the same length as buffer.")
+        typecode = "q" if view.format not in FLOAT_FORMATS and isinstance(factor, int) else "d"
+        if np is not None:
+            source = np.asarray(view).astype(np.int64 if typecode == "q" else np.float64, copy=False)
+            if typecode == "q":
+                _check_int64_product(source, factor)
+            result = np.multiply(source, factor, out=None if out_view is None else np.asarray(out_view))
+            return out if out is not None else result
+        source = buffer if isinstance(buffer, array) else view  # Iterating an array is a bit faster than a memoryview
+        try:
+            result = array(typecode, map(operator.mul, source, itertools.repeat(factor, len(view))))
+        except OverflowError:
+            raise OverflowError(INT64_OVERFLOW) from None
+        if out is None:
+            return result
+        out_view[:] = result if out_view.format == typecode else array(out_view.format, result)
+        return out
+
+    def __repr__(self):
+        return f"CachedMultiplier({self.factor!r})"
+
+double = CachedMultiplier(2)
+print(double(5))                                              # Output: 10
+print(CachedMultiplier(2) is double)                          # Output: True (reused from the registry)
+print(double @ CachedMultiplier(3))                           # Output: CachedMultiplier(6)
+print(double.map_batch(array("q", [1, 2, 3])).tolist())          # Output: [2, 4, 6]
+print(double.map_batch(memoryview(array("d", [0.5]))).tolist())  # Output: [1.0]
+
+readings = array("d", [1.0, 2.0, 3.0])
+(double @ CachedMultiplier(0.5)).map_batch(readings, out=readings)  # Scales in place
+print(list(readings))  # Output: [1.0, 2.0, 3.0]
+
+try:
+    double.factor = 3
+except AttributeError as e:
+    print(e)  # Output: CachedMultiplier is immutable.
+try:
+    double.map_batch(array("q", [2 ** 62]))
+except OverflowError as e:
+    print(e)  # Output: The result does not fit in a signed 64-bit integer.
+
+import copy
+import pickle
+
+print(copy.copy(double) is double, copy.deepcopy(double) is double)  # Output: True True
+print(pickle.loads(pickle.dumps(double)) is double)                  # Output: True (same process, same registry)
+
+# 5. Benchmark
+# Scaling `count` values with one call per value, with one `map_batch` call, and a two-step pipeline
+# (scale by 2, then by 3) run step by step or composed into one multiplier.
+# The default count stays small so the file runs quickly; pass `count=10**7` for the full benchmark.
+
+import time
+
+def _timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_multiplier(count=1_000_000):
+    values = list(range(count))
+    buffer = array("q", values)
+    slow_double, slow_triple = Multiplier(2), Multiplier(3)
+    double, triple = CachedMultiplier(2), CachedMultiplier(3)
+
+    results = {
+        "one call per value": _timed(lambda: [slow_double(value) for value in values]),
+        "map_batch": _timed(lambda: double.map_batch(buffer)),
+        "2 steps, per value": _timed(lambda: [slow_triple(slow_double(value)) for value in values]),
+        "2 steps, map_batch": _timed(lambda: triple.map_batch(double.map_batch(buffer))),
+        "composed, map_batch": _timed(lambda: (double @ triple).map_batch(buffer)),
+    }
+    print(f"backend: {'numpy' if np is not None else 'array.array'}")
+    for name, seconds in results.items():
+        print(f"{name:<22} {count / seconds / 1e6:8.1f} M values/s")
+
+benchmark_multiplier()
+# Output without NumPy (numbers depend on your machine):
+# backend: array.array
+# one call per value         ~6 M values/s
+# map_batch                 ~10 M values/s
+# 2 steps, per value       ~3.5 M values/s
+# 2 steps, map_batch         ~5 M values/s
+# composed, map_batch       ~10 M values/s
+# Without NumPy each element is still boxed while it is multiplied, so the batch path is "only" about twice as fast,
+# but it stores 8 bytes per value instead of a list slot plus a Python number, and composition halves the passes.
+# With NumPy installed, `map_batch` reaches hundreds of M values/s
+# (the int64 overflow check reads the buffer once more).
@@ -0,0 +1,325 @@
+# 1. What `ManagedFile` leaves behind
+# `ManagedFile` of the context management section always opens with `'w'` and the default buffering.
+# `__exit__` closes the file, but if the `with` block fails halfway, the partly written file stays on disk,
+# and a reader can also see it while it is being written.
+
+import contextlib
+import errno
+import os
+import tempfile
+
+class ManagedFile:
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __enter__(self):
+        self.file = open(self.filename, 'w')
+        return self.file
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.file.close()
+
+work_dir = tempfile.mkdtemp()
+report = os.path.join(work_dir, "report.txt")
+try:
+    with ManagedFile(report) as f:
+        f.write("header\n")
+        raise RuntimeError("the writer crashed")
+except RuntimeError:
+    pass
+print(open(report).read() == "header\n")  # Output: True (a partial file)
+
+# 2. Buffer size and atomic writes
+# `SafeManagedFile` accepts the usual `open()` options: `mode`, `buffering` (buffer size in bytes) and `encoding`.
+# With `atomic=True`, the data is written to a temporary file in the same directory, which is renamed with
+# `os.replace` only when the `with` block succeeds. On the same file system the rename is atomic: readers see
+# either the old file or the complete new one, never a partial file. On error (in the `with` block, or in
+# `flush`, `fsync`, `close` or the rename, or while opening it), the temporary file is deleted.
+# `fsync=True` also forces the data to the disk before the rename, so the new file survives a power loss,
+# at the price of waiting for the disk (see the benchmark).
+# `tempfile.mkstemp` creates the file with the permissions 0o600 (readable only by its owner), so we give it the
+# permissions of the file it replaces, or the ones `open` would use (0o666 minus the umask).
+# The umask can only be read by changing it, which is not safe with threads: it is read once, at import.
+# Mode "x" must fail if the file exists. `os.replace` would overwrite it, so an exclusive atomic write checks for the
+# file in `__enter__` and publishes the temporary file with `os.link`, which fails if the name was taken meanwhile.
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+class SafeManagedFile:
+    def __init__(self, filename, mode="w", buffering=-1, encoding=None, atomic=False, fsync=False):
+        if atomic and not mode.startswith(("w", "x")):
+            raise ValueError("atomic writes need a 'w' or 'x' mode.")
+        self.filename = filename
+        self.mode = mode
+        self.buffering = buffering
+        self.encoding = encoding
+        self.atomic = atomic
+        self.fsync = fsync
+        self._temp_name = None
+
+    def __enter__(self):
+        if self.atomic:
+            if "x" in self.mode and os.path.lexists(self.filename):
+                raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), self.filename)
+            directory, name = os.path.split(os.path.abspath(self.filename))
+            fd, self._temp_name = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+            try:
+                try:
+                    permissions = os.stat(self.filename).st_mode & 0o7777
+                except FileNotFoundError:
+                    permissions = 0o666 & ~_UMASK
+                os.chmod(self._temp_name, permissions)
+                mode = self.mode.replace("x", "w")  # The temporary file already exists
+                self.file = os.fdopen(fd, mode, buffering=self.buffering, encoding=self.encoding)
+            except BaseException:
+                # `__exit__` is not called when `__enter__` fails: clean up here
+                with contextlib.suppress(OSError):  # `os.fdopen` may already have closed it
+                    os.close(fd)
+                os.unlink(self._temp_name)
+                self._temp_name = None
+                raise
+        else:
+            self.file = open(self.filename, self.mode, buffering=self.buffering, encoding=self.encoding)
+        return self.file
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        temp_name, self._temp_name = self._temp_name, None
+        try:
+            try:
+                if exc_type is None and self.fsync:
+                    self.file.flush()
+                    os.fsync(self.file.fileno())
+            finally:
+                self.file.close()
+            if temp_name is not None and exc_type is None:
+                if "x" in self.mode:
+                    os.link(temp_name, self.filename)  # The temporary name is deleted below
+                else:
+                    os.replace(temp_name, self.filename)
+                    temp_name = None
+        finally:
+            if temp_name is not None:
+                os.unlink(temp_name)
+        return False  # Exceptions are not swallowed
+
+try:
+    with SafeManagedFile(report, atomic=True) as f:
+        f.write("new header\n")
+        raise RuntimeError("the writer crashed")
+except RuntimeError:
+    pass
+print(open(report).read() == "header\n", len(os.listdir(work_dir)))  # Output: True 1 (unchanged, no temporary file)
+
+with SafeManagedFile(report, buffering=1 << 16, atomic=True, fsync=True) as f:
+    f.write("complete report\n")
+print(open(report).read().strip())  # Output: complete report
+print(oct(os.stat(report).st_mode & 0o777))  # Output: 0o644 (with the usual umask 0o022), not 0o600
+try:
+    with SafeManagedFile(report, mode="x", atomic=True) as f:
+        f.write("overwritten?\n")
+except FileExistsError:
+    print(open(report).read().strip())  # Output: complete report
+
+# 3. A pool of open handles
+# A writer that appends records to many files would open and close a file for each record.
+# `FileHandlePool` keeps the handles open and reuses them, with a limit on the number of open descriptors
+# (the operating system refuses to open more than `ulimit -n` files per process, often 1024).
+# - Handles are stored in an `OrderedDict` from the least to the most recently used one (LRU order).
+#   When `max_open` is reached, the least recently used handle is closed.
+# - A file is truncated the first time it is opened, and reopened in append mode after an eviction.
+# - The pool is used in a `with` block: an `ExitStack` runs the cleanup (closing every remaining handle)
+#   when the block ends, even on error. An `ExitStack` can't forget a single callback, so the handles evicted
+#   in the meantime are closed directly by the pool.
+
+from collections import OrderedDict
+from contextlib import ExitStack
+
+class FileHandlePool:
+    def __init__(self, max_open=128, buffering=-1, encoding=None):
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1.")
+        self.max_open = max_open
+        self.buffering = buffering
+        self.encoding = encoding
+        self._handles = OrderedDict()
+        self._opened = set()
+        self._stack = ExitStack()
+
+    def __enter__(self):
+        self._stack.callback(self.close_all)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return self._stack.__exit__(exc_type, exc_value, exc_traceback)
+
+    def get(self, filename):
+        handle = self._handles.get(filename)
+        if handle is not None:
+            self._handles.move_to_end(filename)
+            return handle
+        if len(self._handles) >= self.max_open:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+        mode = "a" if filename in self._opened else "w"
+        handle = open(filename, mode, buffering=self.buffering, encoding=self.encoding)
+        self._opened.add(filename)
+        self._handles[filename] = handle
+        return handle
+
+    def write(self, filename, data):
+        return self.get(filename).write(data)
+
+    def close_all(self):
+        while self._handles:
+            _, handle = self._handles.popitem(last=False)
+            handle.close()
+
+    def __len__(self):
+        return len(self._handles)
+
+with FileHandlePool(max_open=2) as pool:
+    for i in range(6):
+        pool.write(os.path.join(work_dir, f"log_{i % 3}.txt"), f"record {i}\n")
+    print(len(pool))  # Output: 2
+print(open(os.path.join(work_dir, "log_0.txt")).read().split("\n"))  # Output: ['record 0', 'record 3', '']
+
+# 4. Async variant
+# File I/O blocks, so calling `write` in a coroutine would freeze the event loop.
+# `AsyncManagedFile` runs the blocking calls (`__enter__`, `write`, `__exit__`) in a thread pool with
+# `loop.run_in_executor` and is used with `async with`.
+# Each call to the thread pool costs a few microseconds, so for many small files `write_file_async` does
+# open, write and close in a single call, and `write_files_async` writes many files at the same time.
+# A semaphore limits the number of files being written at once, and so the number of open descriptors.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+class AsyncManagedFile:
+    def __init__(self, filename, executor=None, **options):
+        self._managed = SafeManagedFile(filename, **options)
+        self._executor = executor
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        self._file = await loop.run_in_executor(self._executor, self._managed.__enter__)
+        return self
+
+    async def write(self, data):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._file.write, data)
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._managed.__exit__, exc_type, exc_value, exc_traceback)
+
+def _write_file(filename, data, options):
+    with SafeManagedFile(filename, **options) as f:
+        f.write(data)
+
+async def write_file_async(filename, data, executor=None, **options):
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, _write_file, filename, data, options)
+
+async def write_files_async(items, workers=8, **options):
+    semaphore = asyncio.Semaphore(workers * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        async def write_one(filename, data):
+            async with semaphore:
+                await write_file_async(filename, data, executor, **options)
+
+        await asyncio.gather(*(write_one(filename, data) for filename, data in items))
+
+async def _async_example():
+    async with AsyncManagedFile(os.path.join(work_dir, "async.txt"), atomic=True) as f:
+        await f.write("written from a thread\n")
+    await write_files_async([(os.path.join(work_dir, f"small_{i}.txt"), "Hello, world!") for i in range(3)])
+
+asyncio.run(_async_example())
+print(open(os.path.join(work_dir, "async.txt")).read().strip())  # Output: written from a thread
+print(sorted(name for name in os.listdir(work_dir) if name.startswith("small_")))
+# Output: ['small_0.txt', 'small_1.txt', 'small_2.txt']
+
+# 5. Benchmark
+# Writing `count` small files (100 bytes each) with each approach, then appending `count` records
+# to 200 files with one open/close per record or with a handle pool.
+# The default count stays small so the file runs quickly: pass `count=100_000` for the full benchmark.
+# The results depend a lot on the file system: `fsync` is almost free on a RAM disk (tmpfs) and costs
+# milliseconds per file on a hard disk.
+
+import shutil
+import time
+
+def _rate(func, count):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+def _write_sequentially(names, data, **options):
+    for name in names:
+        with SafeManagedFile(name, **options) as f:
+            f.write(data)
+
+def _write_original(names, data):
+    for name in names:
+        with ManagedFile(name) as f:
+            f.write(data)
+
+def _append_reopening(names, records):
+    for i, record in enumerate(records):
+        with open(names[i % len(names)], "a") as f:
+            f.write(record)
+
+def _append_pooled(names, records):
+    with FileHandlePool(max_open=256) as pool:
+        for i, record in enumerate(records):
+            pool.write(names[i % len(names)], record)
+
+def benchmark_files(count=10_000, workers=8):
+    directory = tempfile.mkdtemp()
+    data = "x" * 99 + "\n"
+    synced = max(count // 10, 1)  # `fsync` is slow: fewer files
+
+    def new_names(label, size=count):
+        # Every approach creates new files in its own directory
+        os.mkdir(os.path.join(directory, label))
+        return [os.path.join(directory, label, f"file_{i}.txt") for i in range(size)]
+
+    def write_async(label, size=count, **options):
+        items = [(name, data) for name in new_names(label, size)]
+        return lambda: asyncio.run(write_files_async(items, workers, **options))
+
+    tests = (
+        ("ManagedFile", count, lambda names=new_names("original"): _write_original(names, data)),
+        ("buffering=4096", count, lambda names=new_names("buffered"): _write_sequentially(names, data, buffering=4096)),
+        ("atomic", count, lambda names=new_names("atomic"): _write_sequentially(names, data, atomic=True)),
+        ("atomic + fsync", synced,
+         lambda names=new_names("fsync", synced): _write_sequentially(names, data, atomic=True, fsync=True)),
+        (f"async, {workers} threads", count, write_async("async")),
+        ("async atomic", count, write_async("async_atomic", atomic=True)),
+        ("async atomic + fsync", synced, write_async("async_fsync", synced, atomic=True, fsync=True)),
+    )
+    for name, size, func in tests:
+        print(f"{name:<24} {_rate(func, size):10.0f} files/s")
+
+    logs = [os.path.join(directory, f"log_{i}.txt") for i in range(200)]
+    records = [data] * count
+    print(f"{'append, reopening':<24} {_rate(lambda: _append_reopening(logs, records), count):10.0f} records/s")
+    print(f"{'append, handle pool':<24} {_rate(lambda: _append_pooled(logs, records), count):10.0f} records/s")
+    shutil.rmtree(directory)
+
+benchmark_files()
+shutil.rmtree(work_dir)
+# Output on ext4 (numbers depend a lot on your machine, disk and file system, and vary between runs):
+# ManagedFile               ~5000-50000 files/s
+# buffering=4096            ~5000-50000 files/s
+# atomic                    ~4000-20000 files/s
+# atomic + fsync               ~700-7000 files/s
+# async, 8 threads           ~3000-15000 files/s
+# async atomic               ~3000-10000 files/s
+# async atomic + fsync         ~2500-4500 files/s
+# append, reopening               ~70000 records/s
+# append, handle pool           ~1000000 records/s
+# Creating small files is limited by the file system, not by Python: the buffer size barely matters, and an atomic
+# write costs one more file creation and a rename. Threads don't speed up cached writes (they mostly add overhead),
+# but they overlap the waits of `fsync`. Keeping handles open is the big win for many small appends.
@@ -0,0 +1,325 @@
+# 1. Front edits on a plain list
+# `CustomList` of the length, indexing and slicing section stores its items in a Python `list`:
+# an array of pointers. Deleting or inserting at position `i` moves every item after `i` by one slot,
+# so `del my_list[0]` on a list of a million items moves a million pointers (O(n)).
+# `collections.deque` is fast at both ends, but indexing and editing in the middle are O(n) too.
+
+class CustomList:
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __setitem__(self, index, value):
+        self.items[index] = value
+
+    def __delitem__(self, index):
+        del self.items[index]
+
+my_list = CustomList([10, 20, 30, 40])
+del my_list[0]
+print(my_list[0])  # Output: 20
+
+# 2. A blocked list
+# `BlockList` splits the items into chunks of at most `2 * load` items (a list of small lists, like the leaves of
+# a B+-tree). An edit only moves the items of one chunk, so its cost depends on `load`, not on the list size.
+# - A chunk that grows above `2 * load` items is split in two, and an empty chunk is removed.
+# - To find the chunk that holds position `i`, a Fenwick tree (binary indexed tree) stores the chunk sizes:
+#   it finds a position and updates a size in O(log(number of chunks)) steps.
+# - When chunks are split or removed, the tree is marked as stale and rebuilt in O(number of chunks) the next time
+#   it is needed. This happens once every `load` edits or so, which keeps the average cost low.
+# - The first and the last chunk are found without the tree, so edits at both ends never rebuild it.
+
+import itertools
+
+class BlockList:
+    def __init__(self, items=(), load=256):
+        if load < 2:
+            raise ValueError("load must be at least 2.")
+        self._load = load
+        items = list(items)
+        self._chunks = [items[i:i + load] for i in range(0, len(items), load)]
+        self._len = len(items)
+        self._tree = None
+
+    def _build_tree(self):
+        # 1-based Fenwick tree: `tree[i]` holds the total size of the chunks `i - (i & -i)` to `i - 1`
+        tree = [0]
+        tree.extend(len(chunk) for chunk in self._chunks)
+        size = len(tree) - 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, chunk_index, delta):
+        tree = self._tree
+        if tree is None:
+            return
+        i = chunk_index + 1
+        size = len(tree) - 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        # Returns the chunk that holds position `index` (0 <= index < len) and the offset inside it
+        chunks = self._chunks
+        first = len(chunks[0])
+        if index < first:
+            return 0, index
+        last_start = self._len - len(chunks[-1])
+        if index >= last_start:
+            return len(chunks) - 1, index - last_start
+        tree = self._tree if self._tree is not None else self._build_tree()
+        size = len(tree) - 1
+        position = 0
+        bit = 1 << (size.bit_length() - 1)
+        while bit:
+            following = position + bit
+            if following <= size and tree[following] <= index:
+                position = following
+                index -= tree[following]
+            bit >>= 1
+        return position, index
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockList index out of range")
+        return index
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._chunks)
+
+    def __reversed__(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    # 3. Slicing
+    # A slice with step 1 copies only the chunks it covers: O(k + log n) for k items, instead of
+    # building the whole list first. Other steps read each item by position (O(k log n)).
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return BlockList((self[i] for i in range(start, stop, step)), self._load)
+            result = BlockList(load=self._load)
+            if start >= stop:
+                return result
+            chunk_index, offset = self._locate(start)
+            remaining = stop - start
+            while remaining:
+                part = self._chunks[chunk_index][offset:offset + remaining]
+                result._chunks.append(part)
+                remaining -= len(part)
+                chunk_index += 1
+                offset = 0
+            result._len = stop - start
+            return result
+        chunk_index, offset = self._locate(self._normalize(index))
+        return self._chunks[chunk_index][offset]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            values = list(value)
+            if step == 1:
+                del self[start:stop]
+                self._insert_many(start, values)
+                return
+            positions = range(start, stop, step)
+            if len(values) != len(positions):
+                raise ValueError(f"attempt to assign sequence of size {len(values)} "
+                                 f"to extended slice of size {len(positions)}")
+            for position, item in zip(positions, values):
+                self[position] = item
+            return
+        chunk_index, offset = self._locate(self._normalize(index))
+        self._chunks[chunk_index][offset] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                for position in sorted(range(start, stop, step), reverse=True):
+                    del self[position]
+            elif start < stop:
+                self._delete_range(start, stop)
+            return
+        chunk_index, offset = self._locate(self._normalize(index))
+        chunk = self._chunks[chunk_index]
+        del chunk[offset]
+        self._len -= 1
+        if chunk:
+            self._tree_add(chunk_index, -1)
+        else:
+            del self._chunks[chunk_index]
+            self._tree = None
+
+    def _delete_range(self, start, stop):
+        chunk_index, offset = self._locate(start)
+        remaining = stop - start
+        while remaining:
+            chunk = self._chunks[chunk_index]
+            count = min(len(chunk) - offset, remaining)
+            del chunk[offset:offset + count]
+            remaining -= count
+            if chunk:
+                chunk_index += 1
+            else:
+                del self._chunks[chunk_index]
+            offset = 0
+        self._len -= stop - start
+        self._tree = None
+
+    def insert(self, index, value):
+        if index < 0:
+            index = max(index + self._len, 0)
+        if index >= self._len:
+            self.append(value)
+            return
+        chunk_index, offset = self._locate(index)
+        chunk = self._chunks[chunk_index]
+        chunk.insert(offset, value)
+        self._len += 1
+        if len(chunk) > 2 * self._load:
+            self._chunks[chunk_index:chunk_index + 1] = [chunk[:self._load], chunk[self._load:]]
+            self._tree = None
+        else:
+            self._tree_add(chunk_index, 1)
+
+    def append(self, value):
+        if self._chunks and len(self._chunks[-1]) < 2 * self._load:
+            self._chunks[-1].append(value)
+            self._tree_add(len(self._chunks) - 1, 1)
+        else:
+            self._chunks.append([value])
+            self._tree = None
+        self._len += 1
+
+    def extend(self, values):
+        self._insert_many(self._len, list(values))
+
+    def _insert_many(self, index, values):
+        if not values:
+            return
+        load = self._load
+        if index == self._len:
+            if self._chunks and len(self._chunks[-1]) < load:
+                room = load - len(self._chunks[-1])
+                self._chunks[-1].extend(values[:room])
+                values_left = values[room:]
+            else:
+                values_left = values
+            self._chunks.extend(values_left[i:i + load] for i in range(0, len(values_left), load))
+        else:
+            chunk_index, offset = self._locate(index)
+            chunk = self._chunks[chunk_index]
+            merged = chunk[:offset] + values + chunk[offset:]
+            self._chunks[chunk_index:chunk_index + 1] = [merged[i:i + load] for i in range(0, len(merged), load)]
+        self._len += len(values)
+        self._tree = None
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty BlockList")
+        if index == -1:
+            chunk = self._chunks[-1]
+            value = chunk.pop()
+            self._len -= 1
+            if chunk:
+                self._tree_add(len(self._chunks) - 1, -1)
+            else:
+                self._chunks.pop()
+                self._tree = None
+            return value
+        value = self[index]
+        del self[index]
+        return value
+
+    def __repr__(self):
+        return f"BlockList({list(self)!r})"
+
+queue = BlockList(range(10), load=2)
+del queue[0]
+queue.insert(4, "new")
+print(queue[0], queue[4], queue[-1], len(queue))  # Output: 1 new 9 10
+print(queue[2:6])                                 # Output: BlockList([3, 4, 'new', 5])
+print(queue[::-3])                                # Output: BlockList([9, 6, 4, 1])
+del queue[1:5]
+queue[0:1] = ["a", "b"]
+print(queue)  # Output: BlockList(['a', 'b', 5, 6, 7, 8, 9])
+
+# `CustomList` only uses `len()`, indexing and `del`, so a `BlockList` can be used as its backend unchanged:
+my_list = CustomList(BlockList([10, 20, 30, 40]))
+del my_list[0]
+my_list[1] = 99
+print(len(my_list), my_list[0], my_list[1])  # Output: 3 20 99
+
+# 4. Benchmark
+# Average time of one edit on a sequence of `size` items, for `list`, `deque` and `BlockList`:
+# deleting and inserting at the front, in the middle and at the back, and reading a random position.
+# The default size keeps the file quick to run: pass `size=1_000_000` to see the O(n) costs grow.
+
+import random
+import time
+from collections import deque
+
+def _edits(sequence, kind, ops, rng):
+    size = len(sequence)
+    positions = [rng.randrange(size // 4, 3 * size // 4) for _ in range(ops)]
+    start = time.perf_counter()
+    if kind == "front del":
+        for _ in range(ops):
+            del sequence[0]
+    elif kind == "front insert":
+        for i in range(ops):
+            sequence.insert(0, i)
+    elif kind == "middle del":
+        for position in positions:
+            del sequence[position]
+    elif kind == "middle insert":
+        for position in positions:
+            sequence.insert(position, position)
+    elif kind == "back append":
+        for i in range(ops):
+            sequence.append(i)
+    elif kind == "back pop":
+        for _ in range(ops):
+            sequence.pop()
+    elif kind == "random read":
+        for position in positions:
+            sequence[position]
+    return (time.perf_counter() - start) / ops * 1e6
+
+def benchmark_block_list(size=200_000, ops=5_000):
+    kinds = ("front del", "front insert", "middle del", "middle insert", "back append", "back pop", "random read")
+    print(f"{'':<14} {'list':>9} {'deque':>9} {'BlockList':>10}  (µs per operation)")
+    for kind in kinds:
+        rng = random.Random(0)
+        times = [_edits(factory(range(size)), kind, ops, rng) for factory in (list, deque, BlockList)]
+        print(f"{kind:<14} {times[0]:>9.3f} {times[1]:>9.3f} {times[2]:>10.3f}")
+
+benchmark_block_list()
+# Output (numbers depend on your machine):
+#                     list     deque  BlockList  (µs per operation)
+# front del            ~50     ~0.09       ~0.9
+# front insert        ~130     ~0.15       ~0.9
+# middle del           ~20       ~55         ~3
+# middle insert        ~50       ~50       ~2.5
+# back append        ~0.04     ~0.05       ~0.3
+# back pop           ~0.04     ~0.04       ~0.3
+# random read         ~0.1        ~3       ~2.3
+# `list` and `deque` edits grow with the size (O(n)), while `BlockList` stays around a microsecond or two.
+# `deque` remains the best choice when only the ends are edited, and `list` when the middle is only read.
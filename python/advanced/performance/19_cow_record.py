@@ -0,0 +1,287 @@
+# 1. The cost of `copy.deepcopy`
+# `Person.__deepcopy__` of the object copying section calls `copy.deepcopy` on every field.
+# For each object, `copy.deepcopy` looks up a copier for its type, records it in the `memo` dictionary
+# (so shared objects and cycles are copied only once), and copies the `__dict__` field by field.
+# On a large nested record, this visits every object of the graph, even the ones that will never change.
+
+import copy
+
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def __copy__(self):
+        return Person(self.name, self.age)
+
+    def __deepcopy__(self, memo):
+        return Person(copy.deepcopy(self.name, memo), copy.deepcopy(self.age, memo))
+
+p1 = Person("Alice", 30)
+p3 = copy.deepcopy(p1)
+print(p3.name, p3 is p1)  # Output: Alice False
+
+# 2. A fast deep copy for plain data
+# Numbers, strings, bytes and `None` can't change, so a copy can share them: `fast_deepcopy` returns them as is,
+# without a call or a `memo` entry. Lists, dicts and tuples are copied with a direct loop, and only containers
+# are recorded in `memo` (a shared list is still copied once, and cycles still work).
+# Tuples that only hold immutable values are returned unchanged, like `copy.deepcopy` does.
+# Any other type falls back to `copy.deepcopy` with the same `memo` (and so to its `__deepcopy__` method).
+
+import operator
+
+ATOMIC_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+def fast_deepcopy(value, memo=None):
+    cls = type(value)
+    if cls in ATOMIC_TYPES:
+        return value
+    if memo is None:
+        memo = {}
+    key = id(value)
+    if key in memo:
+        return memo[key]
+    if cls is list:
+        result = []
+        memo[key] = result
+        result.extend([item if type(item) in ATOMIC_TYPES else fast_deepcopy(item, memo) for item in value])
+    elif cls is dict:
+        result = {}
+        memo[key] = result
+        for name, item in value.items():
+            result[name] = item if type(item) in ATOMIC_TYPES else fast_deepcopy(item, memo)
+    elif cls is tuple:
+        items = [item if type(item) in ATOMIC_TYPES else fast_deepcopy(item, memo) for item in value]
+        # A tuple can't be recorded before its items are copied: if one of them refers back to the tuple,
+        # the cycle has already created (and recorded) its copy
+        if key in memo:
+            return memo[key]
+        result = value if all(map(operator.is_, items, value)) else tuple(items)
+        memo[key] = result
+    else:
+        result = copy.deepcopy(value, memo)
+    return result
+
+config = {"name": "db", "ports": [5432, 5433], "tags": ("primary", "eu")}
+config_copy = fast_deepcopy(config)
+config_copy["ports"].append(5434)
+print(config["ports"], config_copy["tags"] is config["tags"])  # Output: [5432, 5433] True
+cycle = ([],)
+cycle[0].append(cycle)
+cycle_copy = fast_deepcopy(cycle)
+print(cycle_copy[0][0] is cycle_copy, cycle_copy is cycle)  # Output: True False
+
+# 3. Copy-on-write records
+# `CowRecord` keeps its fields in a dictionary. `copy.copy` (and `copy.deepcopy`) create a new record that
+# shares the same dictionary: O(1), whatever the size of the record. Both records are marked as shared.
+# - The first write to a shared record copies the dictionary (O(number of fields)) and then changes the copy:
+#   the other record still sees the old values.
+# - Nested values are shared too. When a shared record copies its dictionary, it also "detaches" the values that
+#   can change: a nested `CowRecord` gets an O(1) copy-on-write copy of its own, any other mutable value
+#   (list, dict...) gets a `fast_deepcopy`. Immutable values (numbers, strings...) are always shared.
+# - Reading a mutable field from a shared record detaches it first, because the caller may change it.
+#   Reading an immutable field costs nothing more.
+# - A mutable value read from a record that is not shared is "lent": the caller can change it later without going
+#   through the record. The dictionary of a record that has lent values can't be shared, so copying it detaches
+#   the mutable values for the copy (O(number of fields)), and the caller's references stay with the original.
+#   Values passed to the constructor or assigned to a field belong to the record, like with a dataclass.
+# Writing deep inside a copied tree therefore copies only the records on the path to the change
+# ("path copying", like in persistent data structures): everything else stays shared.
+# Subclasses keep their data in the fields and declare `__slots__ = ()`.
+# `pickle` creates an object without calling `__init__`, so `__reduce__` creates an empty record and passes a copy of
+# its fields as the state given to `__setstate__` (after the record exists, so cycles between records work).
+# `__getattr__` never looks up its own slots: an unset slot would call `__getattr__` again, forever.
+
+def _new_record(cls):
+    record = object.__new__(cls)
+    object.__setattr__(record, "_fields", {})
+    object.__setattr__(record, "_shared", False)
+    object.__setattr__(record, "_lent", False)
+    return record
+
+class CowRecord:
+    __slots__ = ("_fields", "_shared", "_lent")
+
+    def __init__(self, **fields):
+        object.__setattr__(self, "_fields", fields)
+        object.__setattr__(self, "_shared", False)
+        object.__setattr__(self, "_lent", False)
+
+    @staticmethod
+    def _detached(fields):
+        fields = dict(fields)
+        for name, value in fields.items():
+            if type(value) not in ATOMIC_TYPES:
+                fields[name] = fast_deepcopy(value)
+        return fields
+
+    def _own(self):
+        object.__setattr__(self, "_fields", self._detached(self._fields))
+        object.__setattr__(self, "_shared", False)
+
+    def __getattr__(self, name):
+        # Only called for names that are not slots, methods or class attributes: the fields
+        if name in CowRecord.__slots__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        try:
+            value = self._fields[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        if type(value) not in ATOMIC_TYPES:
+            if self._shared:
+                self._own()
+                value = self._fields[name]
+            object.__setattr__(self, "_lent", True)
+        return value
+
+    def __setattr__(self, name, value):
+        if self._shared:
+            self._own()
+        self._fields[name] = value
+
+    def __delattr__(self, name):
+        if self._shared:
+            self._own()
+        try:
+            del self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __copy__(self):
+        clone = object.__new__(type(self))
+        object.__setattr__(clone, "_lent", False)
+        if self._lent:
+            # The lent values belong to `self`: the copy gets detached values of its own
+            object.__setattr__(clone, "_fields", self._detached(self._fields))
+            object.__setattr__(clone, "_shared", False)
+            return clone
+        object.__setattr__(clone, "_fields", self._fields)
+        object.__setattr__(clone, "_shared", True)
+        object.__setattr__(self, "_shared", True)
+        return clone
+
+    def __reduce__(self):
+        return _new_record, (type(self),), dict(self._fields)
+
+    def __setstate__(self, fields):
+        object.__setattr__(self, "_fields", fields)
+
+    def __deepcopy__(self, memo):
+        # Every change goes through copy-on-write, so the shared copy behaves like a deep copy
+        clone = self.__copy__()
+        memo[id(self)] = clone
+        return clone
+
+    def __eq__(self, other):
+        if not isinstance(other, CowRecord):
+            return NotImplemented
+        return type(self) is type(other) and self._fields == other._fields
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._fields.items())
+        return f"{type(self).__name__}({fields})"
+
+class Address(CowRecord):
+    __slots__ = ()
+
+    def __init__(self, city, street):
+        super().__init__(city=city, street=street)
+
+class CowPerson(CowRecord):
+    __slots__ = ()
+
+    def __init__(self, name, age, address, tags=()):
+        super().__init__(name=name, age=age, address=address, tags=list(tags))
+
+alice = CowPerson("Alice", 30, Address("Paris", "Rue de Rivoli"), ["admin"])
+clone = copy.deepcopy(alice)
+print(clone._fields is alice._fields)  # Output: True (nothing copied yet)
+clone.address.city = "Lyon"
+clone.tags.append("remote")
+print(alice.address.city, alice.tags)  # Output: Paris ['admin']
+print(clone.address.city, clone.tags)  # Output: Lyon ['admin', 'remote']
+print(clone.name is alice.name)        # Output: True (immutable values stay shared)
+
+bob = CowPerson("Bob", 25, Address("Nantes", "Rue Crébillon"), ["admin"])
+tags, address = bob.tags, bob.address  # Lent: they can change without going through `bob`
+snapshot = copy.deepcopy(bob)
+tags.append("leaked")
+address.city = "Lyon"
+print(bob.tags, bob.address.city)            # Output: ['admin', 'leaked'] Lyon
+print(snapshot.tags, snapshot.address.city)  # Output: ['admin'] Nantes
+
+import pickle
+
+print(pickle.loads(pickle.dumps(bob.address)))  # Output: Address(city='Lyon', street='Rue Crébillon')
+print(hasattr(object.__new__(Address), "city"))  # Output: False (no infinite recursion)
+
+# 4. Benchmark
+# A tree of records, `depth` levels deep, where every node has `branching` children and a few fields.
+# We compare `copy.deepcopy` on plain objects with the copy-on-write records: the copy itself, and a copy
+# followed by one write to a leaf. `fast_deepcopy` is also compared with `copy.deepcopy` on nested dicts and lists.
+
+import time
+
+class PlainNode:
+    def __init__(self, value, label, children):
+        self.value = value
+        self.label = label
+        self.children = children
+
+class CowNode(CowRecord):
+    __slots__ = ()
+
+    def __init__(self, value, label, children):
+        super().__init__(value=value, label=label, children=children)
+
+def _build(node_class, depth, branching):
+    children = tuple(_build(node_class, depth - 1, branching) for _ in range(branching)) if depth > 1 else ()
+    return node_class(depth, f"node at depth {depth}", children)
+
+def _build_plain_data(depth, branching):
+    children = [_build_plain_data(depth - 1, branching) for _ in range(branching)] if depth > 1 else []
+    return {"value": depth, "label": f"node at depth {depth}", "scores": [1.5, 2.5], "children": children}
+
+def _write_leaf(node):
+    while node.children:
+        node = node.children[0]
+    node.value = -1
+
+def _timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark_copies(depth=7, branching=4):
+    plain = _build(PlainNode, depth, branching)
+    cow = _build(CowNode, depth, branching)
+    data = _build_plain_data(depth, branching)
+    nodes = sum(branching ** level for level in range(depth))
+
+    def cow_copy_and_write():
+        _write_leaf(copy.deepcopy(cow))
+
+    results = {
+        "deepcopy, plain objects": _timed(lambda: copy.deepcopy(plain)),
+        "deepcopy, CowRecord": _timed(lambda: copy.deepcopy(cow)),
+        "CowRecord copy + 1 write": _timed(cow_copy_and_write),
+        "deepcopy, dicts/lists": _timed(lambda: copy.deepcopy(data)),
+        "fast_deepcopy": _timed(lambda: fast_deepcopy(data)),
+    }
+    print(f"{nodes} nodes")
+    for name, seconds in results.items():
+        print(f"{name:<26} {seconds * 1000:10.3f} ms")
+
+benchmark_copies()
+# Output (numbers depend on your machine):
+# 5461 nodes
+# deepcopy, plain objects           ~70 ms
+# deepcopy, CowRecord            ~0.004 ms
+# CowRecord copy + 1 write        ~0.13 ms
+# deepcopy, dicts/lists             ~50 ms
+# fast_deepcopy                     ~26 ms
+# The copy-on-write copy doesn't depend on the size of the tree, and a write only copies the path to the leaf
+# (and the sibling tuples on that path). The price is paid on access: each field read goes through `__getattr__`.
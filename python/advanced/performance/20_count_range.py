@@ -0,0 +1,172 @@
+# 1. A one-shot iterator
+# `Counter` of the iterator section returns itself from `__iter__`, so its position is stored in the object:
+# once a loop has consumed it, a second loop gets nothing.
+# It also calls the Python method `__next__` once per number, which costs far more than creating the number.
+
+class Counter:
+    def __init__(self, low, high):
+        self.current = low
+        self.high = high
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.current > self.high:
+            raise StopIteration
+        else:
+            self.current += 1
+            return self.current - 1
+
+counter = Counter(1, 5)
+print(list(counter), list(counter))  # Output: [1, 2, 3, 4, 5] [] (already consumed)
+
+# 2. `CountRange`: a re-iterable, range-like counter
+# `CountRange(low, high, step)` counts from `low` to `high` included, like `Counter`, and stores a built-in `range`:
+# - `__iter__` returns a new iterator each time, so the object can be used in many loops (and many threads).
+#   The iterator is the C iterator of `range`: no Python method call per number.
+# - `__len__` and `__length_hint__` let `list()` and other consumers allocate the right size up front.
+# - `__getitem__` computes `low + index * step` in O(1), and a slice returns a new `CountRange` without building
+#   the numbers. `in` is O(1) too.
+
+from array import array
+
+class CountRange:
+    __slots__ = ("_range",)
+
+    def __init__(self, low, high, step=1):
+        if step == 0:
+            raise ValueError("step must not be zero.")
+        self._range = range(low, high + (1 if step > 0 else -1), step)
+
+    @classmethod
+    def from_range(cls, numbers):
+        counter = cls.__new__(cls)
+        counter._range = numbers
+        return counter
+
+    def __iter__(self):
+        return iter(self._range)
+
+    def __reversed__(self):
+        return reversed(self._range)
+
+    def __len__(self):
+        return len(self._range)
+
+    def __length_hint__(self):
+        return len(self._range)
+
+    def __contains__(self, value):
+        return value in self._range
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountRange.from_range(self._range[index])
+        return self._range[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, CountRange):
+            return NotImplemented
+        return self._range == other._range
+
+    def __reduce__(self):
+        # Pickled as its `range`, for example when it is sent to another process
+        return CountRange.from_range, (self._range,)
+
+    def __repr__(self):
+        numbers = self._range
+        return f"CountRange(start={numbers.start}, stop={numbers.stop}, step={numbers.step})"
+
+    # 3. Chunks for batch consumers
+    # `chunks(size)` yields the numbers as `array('q')` blocks of `size` int64 values (the last one may be shorter).
+    # Each block is built in C from a sub-range, and a batch consumer can pass it to code that works on buffers
+    # (`sum`, `array` methods, NumPy with `np.frombuffer`...) without one Python object per number.
+    # With `as_memoryview=True`, the blocks are returned as `memoryview`s, the buffer interface without copies.
+    def chunks(self, size, as_memoryview=False):
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        numbers = self._range
+        for start in range(0, len(numbers), size):
+            block = array("q", numbers[start:start + size])
+            yield memoryview(block) if as_memoryview else block
+
+    # 4. Shards for multiprocessing
+    # `shards(n)` splits the counter into `n` disjoint `CountRange`s that together cover every number once:
+    # - contiguous shards (the default) have sizes that differ by at most one,
+    # - interleaved shards (`interleaved=True`) take every n-th number, which balances the work when the cost
+    #   of a number grows with its value.
+    # A shard is only a `range`, so sending it to a worker process pickles three integers, not the numbers.
+    def shards(self, count, interleaved=False):
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        numbers = self._range
+        if interleaved:
+            return [CountRange.from_range(numbers[i::count]) for i in range(count)]
+        size, extra = divmod(len(numbers), count)
+        result = []
+        start = 0
+        for i in range(count):
+            stop = start + size + (1 if i < extra else 0)
+            result.append(CountRange.from_range(numbers[start:stop]))
+            start = stop
+        return result
+
+counter = CountRange(1, 5)
+print(list(counter), list(counter))  # Output: [1, 2, 3, 4, 5] [1, 2, 3, 4, 5]
+print(len(counter), counter[-1], 3 in counter)  # Output: 5 5 True
+print(counter[1::2], list(counter[1::2]))       # Output: CountRange(start=2, stop=6, step=2) [2, 4]
+print([list(chunk) for chunk in CountRange(0, 9).chunks(4)])  # Output: [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+print([list(shard) for shard in CountRange(0, 9).shards(3)])  # Output: [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+print([list(shard) for shard in CountRange(0, 9).shards(3, interleaved=True)])
+# Output: [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+
+# 5. Benchmark
+# Summing `count` numbers with one `__next__` call per number (`Counter`) and with the C iterator of `CountRange`,
+# producing the numbers as `array('q')` chunks (what a batch consumer receives), and the sum split into
+# shards on a process pool, where each worker receives a small `CountRange`.
+# The default count stays small so the file runs quickly; pass `count=10**9` with many cores.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+def sum_shard(shard):
+    return sum(shard)
+
+def _count_chunked(counter, chunk_size=65_536):
+    return sum(len(chunk) for chunk in counter.chunks(chunk_size))
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def benchmark_counter(count=10_000_000, workers=None):
+    workers = workers or os.cpu_count() or 1
+    counter = CountRange(0, count - 1)
+
+    def process_pool():
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return sum(pool.map(sum_shard, counter.shards(workers)))
+
+    tests = {
+        "Counter (__next__)": lambda: sum(Counter(0, count - 1)),
+        "CountRange": lambda: sum_shard(counter),
+        "array('q') chunks": lambda: _count_chunked(counter),
+        f"{workers} process shards": process_pool,
+    }
+    for name, func in tests.items():
+        print(f"{name:<22} {count / _timed(func) / 1e6:8.1f} M numbers/s")
+
+# Worker processes may import this file again (on Windows and macOS): the guard keeps them from running the benchmark.
+if __name__ == "__main__":
+    benchmark_counter()
+# Output on a 1-core machine (numbers depend on your machine):
+# Counter (__next__)          ~7 M numbers/s
+# CountRange                 ~40 M numbers/s
+# array('q') chunks          ~12 M numbers/s
+# 1 process shards           ~40 M numbers/s
+# Building the chunks costs more than iterating the range: they pay off when the consumer works on whole buffers
+# (NumPy, `struct`, file writes). With N cores, the shards scale the sum almost N times, minus the start-up
+# of the worker processes.
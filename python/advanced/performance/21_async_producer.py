@@ -0,0 +1,230 @@
+# 1. One item at a time
+# `AsyncCounter` of the async section awaits `asyncio.sleep(0.1)` (its simulated work) inside `__anext__`.
+# The consumer waits for each item before asking for the next one, so the waits never overlap:
+# at most 10 items per second, whatever the machine.
+
+import asyncio
+
+class AsyncCounter:
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def __aiter__(self):
+        self.current = self.low
+        return self
+
+    async def __anext__(self):
+        if self.current > self.high:
+            raise StopAsyncIteration
+        self.current += 1
+        await asyncio.sleep(0.1)  # Simulate async work
+        return self.current - 1
+
+async def main():
+    return [number async for number in AsyncCounter(1, 3)]
+
+print(asyncio.run(main()))  # Output: [1, 2, 3] (after 0.3 seconds)
+
+# 2. `AsyncProducer`
+# The producer runs the async work for many inputs at the same time and hands the results to the consumers:
+# - `concurrency` worker tasks share one iterator over `source`. Each worker takes the next input, awaits
+#   `work(input)` and puts the result in a queue. While one worker waits, the others run.
+# - The queue is an `asyncio.Queue` bounded to `queue_size` items: when the consumers are slower than the
+#   workers, `put` waits until there is room again ("backpressure"), so memory stays bounded.
+# - `__anext__` returns a batch: it waits for one result, then takes whatever else is already in the queue,
+#   up to `batch_size` items, without waiting. Batches amortize the cost of each `await` in the consumer.
+# - Results arrive in completion order, not in the order of `source`.
+# - When the inputs are exhausted, an end marker is put in the queue. A consumer that sees it puts it back
+#   for the other consumers and stops. If `work` raises, the workers are stopped and the consumers
+#   get the exception.
+
+class _Done:
+    pass
+
+_DONE = _Done()
+
+class AsyncProducer:
+    def __init__(self, source, work, concurrency=100, queue_size=1000, batch_size=100):
+        if concurrency < 1 or queue_size < 1 or batch_size < 1:
+            raise ValueError("concurrency, queue_size and batch_size must be at least 1.")
+        self.source = source
+        self.work = work
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self._queue_size = queue_size
+        self._queue = None
+        self._runner = None
+        self._workers = []
+        self._error = None
+
+    def start(self):
+        if self._runner is None:
+            self._queue = asyncio.Queue(self._queue_size)
+            self._runner = asyncio.create_task(self._run())
+        return self
+
+    async def _run(self):
+        try:
+            inputs = iter(self.source)  # Inside the `try`: a source that isn't iterable is an error for the consumers
+            self._workers = [asyncio.create_task(self._worker(inputs)) for _ in range(self.concurrency)]
+            await asyncio.gather(*self._workers)
+        except Exception as e:
+            self._error = e
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        await self._queue.put(_DONE)
+
+    async def _worker(self, inputs):
+        # `next(inputs)` never awaits, so two workers can't read the shared iterator at the same time
+        for value in inputs:
+            result = await self.work(value)
+            await self._queue.put(result)
+
+    def __aiter__(self):
+        return self.start()
+
+    async def __anext__(self):
+        queue = self._queue
+        item = await queue.get()
+        if item is _DONE:
+            queue.put_nowait(_DONE)  # Room is guaranteed: we just took an item
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        batch = [item]
+        while len(batch) < self.batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _DONE:
+                queue.put_nowait(_DONE)
+                break
+            batch.append(item)
+        return batch
+
+    # 3. Cancellation-safe shutdown
+    # `aclose()` cancels the runner, which cancels every worker and waits for them: no task is left running,
+    # even when the consumer stops early (`break`) or is itself cancelled. `async with` calls it on exit.
+    async def aclose(self):
+        if self._runner is None:
+            return
+        self._runner.cancel()
+        await asyncio.gather(self._runner, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.aclose()
+
+    def running_tasks(self):
+        tasks = self._workers + ([self._runner] if self._runner is not None else [])
+        return sum(not task.done() for task in tasks)
+
+# 4. Fan-out to N consumers
+# `fan_out` runs `consumers` tasks that read batches from the same producer: each batch goes to exactly one of them.
+# If one consumer fails, the others are cancelled and the producer is closed before the error is raised.
+
+async def fan_out(producer, handle_batch, consumers=4):
+    async def consume():
+        async for batch in producer:
+            await handle_batch(batch)
+
+    async with producer:
+        tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+async def simulated_io(value, delay=0.1):
+    await asyncio.sleep(delay)  # Same simulated work as `AsyncCounter`
+    return value
+
+async def examples():
+    async with AsyncProducer(range(1, 6), simulated_io, concurrency=5, batch_size=10) as producer:
+        numbers = [number async for batch in producer for number in batch]
+    print(sorted(numbers))  # Output: [1, 2, 3, 4, 5] (after 0.1 seconds, not 0.5)
+
+    producer = AsyncProducer(range(1_000_000), simulated_io, concurrency=50, queue_size=10)
+    async with producer:
+        async for batch in producer:
+            break  # Stop early, while workers are still waiting on their work or on the full queue
+    print(producer.running_tasks())  # Output: 0
+
+    totals = []
+
+    async def handle(batch):
+        totals.append(sum(batch))
+
+    await fan_out(AsyncProducer(range(100), simulated_io, concurrency=20), handle, consumers=3)
+    print(sum(totals))  # Output: 4950
+
+    async def failing(value):
+        if value == 3:
+            raise ValueError("bad input 3")
+        return value
+
+    try:
+        await fan_out(AsyncProducer(range(10), failing), handle)
+    except ValueError as e:
+        print(e)  # Output: bad input 3
+
+    try:
+        async with AsyncProducer(5, simulated_io) as producer:
+            async for batch in producer:
+                pass
+    except TypeError as e:
+        print(e)  # Output: 'int' object is not iterable
+
+asyncio.run(examples())
+
+# 5. Benchmark
+# Items per second with the same simulated work (0.1 seconds of waiting per item): the original `AsyncCounter`
+# on a few items, and `AsyncProducer` with several concurrency levels, one consumer or a fan-out to 4 consumers.
+# With waits that overlap, the throughput grows with `concurrency` until the event loop itself (a few
+# microseconds per task switch) becomes the limit.
+
+import time
+
+async def _rate_original(count):
+    start = time.perf_counter()
+    async for _ in AsyncCounter(1, count):
+        pass
+    return count / (time.perf_counter() - start)
+
+async def _rate_producer(count, concurrency, consumers):
+    received = 0
+
+    async def handle(batch):
+        nonlocal received
+        received += len(batch)
+
+    start = time.perf_counter()
+    await fan_out(AsyncProducer(range(count), simulated_io, concurrency=concurrency), handle, consumers)
+    assert received == count
+    return count / (time.perf_counter() - start)
+
+def benchmark_producer(count=2_000, concurrencies=(100, 1000), original_count=10):
+    print(f"{'AsyncCounter':<36} {asyncio.run(_rate_original(original_count)):10.0f} items/s")
+    for concurrency in concurrencies:
+        for consumers in (1, 4):
+            rate = asyncio.run(_rate_producer(count, concurrency, consumers))
+            label = f"AsyncProducer, {concurrency} workers, {consumers} cons."
+            print(f"{label:<36} {rate:10.0f} items/s")
+
+benchmark_producer()
+# Output (numbers depend on your machine):
+# AsyncCounter                                 ~10 items/s
+# AsyncProducer, 100 workers, 1 cons.        ~1000 items/s
+# AsyncProducer, 100 workers, 4 cons.        ~1000 items/s
+# AsyncProducer, 1000 workers, 1 cons.       ~9000 items/s
+# AsyncProducer, 1000 workers, 4 cons.       ~9000 items/s
+# The throughput is about `concurrency / delay`. More consumers only help when handling a batch also waits
+# (for example a database write); here the consumers are much faster than the workers.
@@ -0,0 +1,313 @@
+# 1. How `match` runs its cases
+# The `match` statements of the pattern matching section (`case Point(1, y)`) and of the conditionals part
+# (`match status_code`) try their cases one after the other, on every call.
+# A class pattern checks `isinstance`, then reads the attributes named in `__match_args__` and compares them.
+# With hundreds of cases, a subject that matches the last case pays for all the others.
+
+class Point:
+    __match_args__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def describe(subject):
+    match subject:
+        case Point(1, y):
+            return f"Point with x=1 and y={y}"
+        case 200:
+            return "OK"
+        case 404:
+            return "Not Found"
+        case _:
+            return "Unknown"
+
+print(describe(Point(1, 2)), describe(404))  # Output: Point with x=1 and y=2 Not Found
+
+# 2. Patterns as data
+# To compile patterns, we describe them with objects instead of `case` syntax:
+# - a literal value (`200`, `"GET"`...) matches an equal value,
+# - `Capture("y")` matches anything and passes it to the handler as the keyword argument `y`,
+#   and `ANY` matches anything without capturing it (like `_`),
+# - `ClassPattern(Point, 1, Capture("y"))` is `Point(1, y)`: an `isinstance` check, then one sub-pattern
+#   per name of `__match_args__`. Sub-patterns can be nested class patterns.
+# A rule is a `(pattern, handler)` pair, and the first rule that matches wins, like the first `case`.
+# Note: literals are compared with `==` through dictionaries, so `1`, `1.0` and `True` are the same literal
+# (`match` compares `True`, `False` and `None` with `is`).
+
+class Capture:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+ANY = Capture(None)
+
+class ClassPattern:
+    __slots__ = ("cls", "fields")
+
+    def __init__(self, cls, *args):
+        names = getattr(cls, "__match_args__", ())
+        if len(args) > len(names):
+            raise TypeError(f"{cls.__name__}() accepts {len(names)} positional sub-patterns ({len(args)} given)")
+        self.cls = cls
+        self.fields = tuple(zip(names, args))
+
+_MISSING = object()
+
+def _match(pattern, value, captures):
+    # Generic matcher, used for the parts of a pattern that the decision tree doesn't cover
+    if isinstance(pattern, Capture):
+        if pattern.name is not None:
+            captures[pattern.name] = value
+        return True
+    if isinstance(pattern, ClassPattern):
+        if not isinstance(value, pattern.cls):
+            return False
+        for name, sub_pattern in pattern.fields:
+            field = getattr(value, name, _MISSING)
+            if field is _MISSING or not _match(sub_pattern, field, captures):
+                return False
+        return True
+    return value == pattern
+
+# 3. The decision tree
+# `PatternMatcher` compiles the rules into one decision tree per type of subject, built the first time a type is seen:
+# - The candidate rules for a type `T` are the literal rules, the class patterns whose class `C` passes
+#   `issubclass(T, C)` (checked once per type, and true for virtual subclasses like `int` of `numbers.Number`,
+#   as with `isinstance`) and the catch-all rules (`Capture`/`ANY`), in their order.
+# - A "column" is something read from the subject: the subject itself (for literals) or one of its attributes.
+#   For each column that has literal sub-patterns, a branch node stores a dictionary `literal -> subtree`: one hash
+#   lookup replaces all the comparisons of that column. Rules without a literal there (wildcards, captures, nested
+#   patterns) are copied into every subtree and into the default subtree, so the rule order is kept.
+# - A leaf holds the remaining candidates, in order. Each one checks what the tree didn't (nested patterns,
+#   literals of columns below the leaf), collects its captures and calls the handler.
+# Copying rules into several subtrees can make the tree large when many columns mix literals and wildcards;
+# the tree stops splitting as soon as a single candidate is left.
+
+_SUBJECT = object()  # The column that holds the subject itself
+
+class _Branch:
+    __slots__ = ("column", "table", "default")
+
+    def __init__(self, column, table, default):
+        self.column = column
+        self.table = table
+        self.default = default
+
+class _Rule:
+    __slots__ = ("handler", "columns", "captures", "nested")
+
+    def __init__(self, handler, columns, captures, nested):
+        self.handler = handler
+        self.columns = columns    # column -> literal
+        self.captures = captures  # list of (name, column)
+        self.nested = nested      # list of (column, nested class pattern)
+
+def _read(subject, column):
+    return subject if column is _SUBJECT else getattr(subject, column, _MISSING)
+
+def _is_hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+class PatternMatcher:
+    def __init__(self, rules, default=None):
+        self.default = default
+        self._rules = list(rules)
+        self._trees = {}
+
+    def __call__(self, subject):
+        try:
+            node = self._trees[type(subject)]
+        except KeyError:
+            node = self._build(type(subject))
+        while type(node) is _Branch:
+            column = node.column
+            value = subject if column is _SUBJECT else getattr(subject, column, _MISSING)
+            try:
+                node = node.table.get(value, node.default)
+            except TypeError:  # Unhashable value: no literal can be equal to it
+                node = node.default
+        for handler, verify in node:
+            if verify is None:
+                return handler()
+            captures = verify(subject)
+            if captures is not None:
+                return handler(**captures)
+        return self.default
+
+    def _build(self, cls):
+        candidates = []
+        hashable = cls.__hash__ is not None
+        for pattern, handler in self._rules:
+            if isinstance(pattern, Capture):
+                captures = [] if pattern.name is None else [(pattern.name, _SUBJECT)]
+                candidates.append(_Rule(handler, {}, captures, []))
+            elif isinstance(pattern, ClassPattern):
+                if issubclass(cls, pattern.cls):
+                    candidates.append(self._class_rule(handler, pattern))
+            elif hashable and _is_hashable(pattern):
+                candidates.append(_Rule(handler, {_SUBJECT: pattern}, [], []))
+            else:
+                # An unhashable literal or subject can't be used as a key: it is compared at the leaf
+                candidates.append(_Rule(handler, {}, [], [(_SUBJECT, pattern)]))
+        columns = []
+        for rule in candidates:
+            for column in rule.columns:
+                if column not in columns:
+                    columns.append(column)
+        tree = self._tree(candidates, columns, 0)
+        self._trees[cls] = tree
+        return tree
+
+    def _class_rule(self, handler, pattern):
+        columns, captures, nested = {}, [], []
+        for name, sub_pattern in pattern.fields:
+            if isinstance(sub_pattern, Capture):
+                if sub_pattern.name is not None:
+                    captures.append((sub_pattern.name, name))
+            elif isinstance(sub_pattern, ClassPattern) or not _is_hashable(sub_pattern):
+                nested.append((name, sub_pattern))
+            else:
+                columns[name] = sub_pattern
+        return _Rule(handler, columns, captures, nested)
+
+    def _tree(self, rules, columns, depth):
+        if len(rules) <= 1 or depth == len(columns):
+            return self._leaf(rules, columns[depth:])
+        column = columns[depth]
+        literals = []
+        for rule in rules:
+            if column in rule.columns and rule.columns[column] not in literals:
+                literals.append(rule.columns[column])
+        if not literals:
+            return self._tree(rules, columns, depth + 1)
+        others = [rule for rule in rules if column not in rule.columns]
+        table = {}
+        for literal in literals:
+            if literal in table:  # Equal literals, like 1 and 1.0
+                continue
+            subset = [rule for rule in rules if column not in rule.columns or rule.columns[column] == literal]
+            table[literal] = self._tree(subset, columns, depth + 1)
+        return _Branch(column, table, self._tree(others, columns, depth + 1))
+
+    def _leaf(self, rules, unchecked_columns):
+        leaf = []
+        for rule in rules:
+            checks = [(column, rule.columns[column]) for column in unchecked_columns if column in rule.columns]
+            verify = self._verifier(rule, checks)
+            leaf.append((rule.handler, verify))
+            if verify is None:
+                break  # This rule always matches here: the next ones can never be reached
+        return leaf
+
+    @staticmethod
+    def _verifier(rule, checks):
+        captures, nested = rule.captures, rule.nested
+        if not captures and not nested and not checks:
+            return None
+
+        def verify(subject):
+            found = {}
+            for column, literal in checks:
+                if _read(subject, column) != literal:
+                    return None
+            for name, column in captures:
+                value = _read(subject, column)
+                if value is _MISSING:
+                    return None
+                found[name] = value
+            for column, pattern in nested:
+                value = _read(subject, column)
+                if value is _MISSING or not _match(pattern, value, found):
+                    return None
+            return found
+
+        return verify
+
+router = PatternMatcher([
+    (ClassPattern(Point, 1, Capture("y")), lambda y: f"Point with x=1 and y={y}"),
+    (ClassPattern(Point, ClassPattern(Point, Capture("a"), ANY), ANY), lambda a: f"Nested point, a={a}"),
+    (200, lambda: "OK"),
+    (404, lambda: "Not Found"),
+    (ANY, lambda: "Unknown"),
+])
+print(router(Point(1, 2)), router(404), router("GET"))  # Output: Point with x=1 and y=2 Not Found Unknown
+print(router(Point(Point(7, 8), 0)))                    # Output: Nested point, a=7
+
+import numbers
+from collections.abc import Mapping
+
+kinds = PatternMatcher([
+    (ClassPattern(numbers.Number), lambda: "number"),
+    (ClassPattern(Mapping), lambda: "mapping"),
+    (ANY, lambda: "other"),
+])
+print(kinds(5), kinds({}), kinds("5"))  # Output: number mapping other (virtual subclasses match, like `match`)
+
+# 4. Benchmark
+# The rules are generated for `cases` = 10, 100 and 1000:
+# - status codes: `case 0`, `case 1`, ... and `case _`,
+# - points: `case Point(0, y)`, `case Point(1, y)`, ... and `case Point(x, y)`.
+# The handwritten `match` statement with the same cases is generated as source code and compiled with `exec`.
+# Subjects are chosen at random among all the cases, so `match` tries half of them on average.
+
+import random
+import time
+
+def _generated_match(cases, kind):
+    lines = ["def handwritten(subject):", "    match subject:"]
+    for i in range(cases):
+        if kind == "status":
+            lines += [f"        case {i}:", f"            return {i}"]
+        else:
+            lines += [f"        case Point({i}, y):", f"            return y + {i}"]
+    if kind == "status":
+        lines += ["        case _:", "            return None"]
+    else:
+        lines += ["        case Point(x, y):", "            return x + y"]
+    namespace = {"Point": Point}
+    exec("\n".join(lines), namespace)
+    return namespace["handwritten"]
+
+def _compiled_match(cases, kind):
+    if kind == "status":
+        rules = [(i, lambda i=i: i) for i in range(cases)]
+        return PatternMatcher(rules)
+    rules = [(ClassPattern(Point, i, Capture("y")), lambda y, i=i: y + i) for i in range(cases)]
+    rules.append((ClassPattern(Point, Capture("x"), Capture("y")), lambda x, y: x + y))
+    return PatternMatcher(rules)
+
+def _ns_per_call(func, subjects):
+    start = time.perf_counter()
+    for subject in subjects:
+        func(subject)
+    return (time.perf_counter() - start) / len(subjects) * 1e9
+
+def benchmark_patterns(case_counts=(10, 100, 1000), calls=100_000):
+    rng = random.Random(0)
+    print(f"{'cases':>6} {'kind':>7} {'match':>10} {'compiled':>10}  (ns per call)")
+    for cases in case_counts:
+        for kind in ("status", "points"):
+            values = [rng.randrange(cases) for _ in range(calls)]
+            subjects = values if kind == "status" else [Point(value, 1) for value in values]
+            handwritten, compiled = _generated_match(cases, kind), _compiled_match(cases, kind)
+            assert all(handwritten(subject) == compiled(subject) for subject in subjects[:1000])
+            print(f"{cases:>6} {kind:>7} {_ns_per_call(handwritten, subjects):>10.0f} "
+                  f"{_ns_per_call(compiled, subjects):>10.0f}")
+
+benchmark_patterns()
+# Output (numbers depend on your machine):
+#  cases    kind      match   compiled  (ns per call)
+#     10  status       ~150       ~500
+#     10  points      ~3000      ~1200
+#    100  status       ~700       ~500
+#    100  points     ~25000      ~1500
+#   1000  status      ~7000       ~500
+#   1000  points    ~300000      ~2000
+# The compiled matcher costs about the same whatever the number of rules. A short `match` on literals is faster,
+# because it runs in the interpreter without a Python function call per step.
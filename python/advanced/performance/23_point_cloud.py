@@ -0,0 +1,263 @@
+# 1. Millions of slotted points
+# The `Point` of the slot management section uses `__slots__`, so it has no `__dict__`, but each point is still
+# an object (about 48 bytes) holding two float objects (24 bytes each), plus a pointer in the list that holds it.
+# Finding the nearest points or the points inside a box means looking at every point: O(n) per query.
+
+class Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+p = Point(1, 2)
+print(p.x, p.y)  # Output: 1 2
+
+# 2. `PointCloud`: contiguous coordinates and a uniform grid
+# - The coordinates are stored in two `array('d')`: 16 bytes per point, no object per point.
+# - The index is a uniform grid over the bounding box, with about `points_per_cell` points per cell.
+#   It is built in bulk: the point indices are sorted by cell (`sorted` with a C-level key function), so the
+#   points of a cell are contiguous in `order`, and `starts[c]:starts[c + 1]` gives the range of cell `c`
+#   (a "compressed sparse row" layout: 8 bytes per point plus 8 bytes per cell).
+#   Cells are numbered column by column, so the cells of one grid column between two rows are one slice of `order`.
+# - The grid suits points spread over the whole area. Very clustered data leaves most cells empty and
+#   puts many points in the others: a k-d tree adapts better to it.
+
+import heapq
+import itertools
+import math
+from array import array
+from collections import Counter
+
+class PointCloud:
+    def __init__(self, xs=(), ys=(), points_per_cell=4):
+        self.xs = array("d", xs)
+        self.ys = array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length.")
+        self.points_per_cell = points_per_cell
+        self._build()
+
+    @classmethod
+    def from_points(cls, points, points_per_cell=4):
+        points = list(points)
+        return cls([p.x for p in points], [p.y for p in points], points_per_cell)
+
+    def _build(self):
+        xs, ys = self.xs, self.ys
+        size = len(xs)
+        self._overflow = {}  # Cell -> indices of the points inserted since the last build
+        self._overflow_count = 0
+        if size == 0:
+            self._x0 = self._y0 = 0.0
+            self._cell = 1.0
+            self._columns = self._rows = 1
+            self._starts = array("q", [0, 0])
+            self._order = array("q")
+            return
+        x0, y0 = min(xs), min(ys)
+        width, height = max(xs) - x0, max(ys) - y0
+        cells = max(1, size // self.points_per_cell)
+        # Square cells of area `width * height / cells`, but never narrower than `max(width, height) / cells`:
+        # for (nearly) collinear points the area is tiny, and the grid would have far more cells than points
+        cell = max(math.sqrt(width * height / cells), max(width, height) / cells) or 1.0  # 1.0: all on one spot
+        self._x0, self._y0, self._cell = x0, y0, cell
+        self._columns, self._rows = int(width / cell) + 1, int(height / cell) + 1
+        ids = array("q", map(self._cell_of, xs, ys))
+        self._order = array("q", sorted(range(size), key=ids.__getitem__))
+        counts = Counter(ids)
+        self._starts = array("q", itertools.accumulate(
+            (counts.get(c, 0) for c in range(self._columns * self._rows)), initial=0))
+
+    def _column_of(self, x):
+        return min(max(int((x - self._x0) / self._cell), 0), self._columns - 1)
+
+    def _row_of(self, y):
+        return min(max(int((y - self._y0) / self._cell), 0), self._rows - 1)
+
+    def _cell_of(self, x, y):
+        return self._column_of(x) * self._rows + self._row_of(y)
+
+    def _cells(self, column, first_row, last_row):
+        # Indices of the points in one grid column, from `first_row` to `last_row` included
+        first = column * self._rows + first_row
+        indices = self._order[self._starts[first]:self._starts[first + last_row - first_row + 1]]
+        if self._overflow:
+            for cell in range(first, first + last_row - first_row + 1):
+                indices.extend(self._overflow.get(cell, ()))
+        return indices
+
+    def __len__(self):
+        return len(self.xs)
+
+    # 3. Incremental insert
+    # A new point inside the grid is appended to the arrays and to a small per-cell overflow dictionary.
+    # A point outside the bounding box, or too many inserted points, triggers a bulk rebuild: rebuilding after
+    # every `n / 4` inserts keeps the average cost of an insert low.
+    def insert(self, x, y):
+        index = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        outside = not (self._x0 <= x <= self._x0 + self._columns * self._cell
+                       and self._y0 <= y <= self._y0 + self._rows * self._cell)
+        if outside or self._overflow_count >= max(1024, index // 4):
+            self._build()
+        else:
+            self._overflow.setdefault(self._cell_of(x, y), []).append(index)
+            self._overflow_count += 1
+        return index
+
+    # 4. Queries
+    # - `within(xmin, ymin, xmax, ymax)` reads only the grid columns and rows that overlap the box, then checks
+    #   the exact coordinates. It returns the indices of the points as an `array('q')`.
+    # - `nearest(x, y, k)` searches rings of cells around the cell of `(x, y)`, keeping the `k` best points in a heap.
+    #   It stops when the k-th distance is smaller than the distance to the unexplored cells.
+    #   It returns the indices of the `k` nearest points, from the nearest.
+    def within(self, xmin, ymin, xmax, ymax):
+        xs, ys = self.xs, self.ys
+        result = array("q")
+        if not len(xs) or xmin > xmax or ymin > ymax:
+            return result
+        first_row, last_row = self._row_of(ymin), self._row_of(ymax)
+        for column in range(self._column_of(xmin), self._column_of(xmax) + 1):
+            for i in self._cells(column, first_row, last_row):
+                if xmin <= xs[i] <= xmax and ymin <= ys[i] <= ymax:
+                    result.append(i)
+        return result
+
+    def nearest(self, x, y, k=1):
+        xs, ys = self.xs, self.ys
+        if not len(xs) or k < 1:
+            return []
+        heap = []  # (-squared distance, -index): the root is the worst of the k best
+        center_column, center_row = self._column_of(x), self._row_of(y)
+        columns, rows, cell = self._columns, self._rows, self._cell
+        radius = 0
+        while True:
+            first_row, last_row = max(center_row - radius, 0), min(center_row + radius, rows - 1)
+            for column in range(center_column - radius, center_column + radius + 1):
+                if not 0 <= column < columns:
+                    continue
+                if radius == 0 or abs(column - center_column) == radius:
+                    ranges = ((first_row, last_row),)  # A whole column of the ring
+                else:
+                    ranges = ((row, row) for row in (center_row - radius, center_row + radius) if 0 <= row < rows)
+                for low, high in ranges:
+                    for i in self._cells(column, low, high):
+                        distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+                        if len(heap) < k:
+                            heapq.heappush(heap, (-distance, -i))
+                        elif -heap[0][0] > distance:
+                            heapq.heapreplace(heap, (-distance, -i))
+            covers_grid = (center_column - radius <= 0 and center_row - radius <= 0
+                           and center_column + radius >= columns - 1 and center_row + radius >= rows - 1)
+            if covers_grid:
+                break
+            if len(heap) == k:
+                margin = min(x - (self._x0 + (center_column - radius) * cell),
+                             self._x0 + (center_column + radius + 1) * cell - x,
+                             y - (self._y0 + (center_row - radius) * cell),
+                             self._y0 + (center_row + radius + 1) * cell - y)
+                if margin > 0 and -heap[0][0] <= margin * margin:
+                    break
+            radius += 1
+        return [-i for _, i in sorted(heap, reverse=True)]
+
+    # 5. Point views
+    # `cloud[i]` returns a `PointView`: a small slotted object that reads its coordinates from the arrays.
+    # It is created only when asked for, and is read-only because moving a point would invalidate the index.
+    def __getitem__(self, index):
+        if not -len(self.xs) <= index < len(self.xs):
+            raise IndexError("PointCloud index out of range")
+        return PointView(self, index % len(self.xs))
+
+    def __iter__(self):
+        return map(PointView, itertools.repeat(self), range(len(self.xs)))
+
+class PointView:
+    __slots__ = ("cloud", "index")
+    __match_args__ = ("x", "y")
+
+    def __init__(self, cloud, index):
+        self.cloud = cloud
+        self.index = index
+
+    @property
+    def x(self):
+        return self.cloud.xs[self.index]
+
+    @property
+    def y(self):
+        return self.cloud.ys[self.index]
+
+    def __repr__(self):
+        return f"PointView(index={self.index}, x={self.x}, y={self.y})"
+
+cloud = PointCloud.from_points([Point(x, y) for x in range(10) for y in range(10)])
+print(list(cloud.within(2, 2, 3, 3)))           # Output: [22, 23, 32, 33]
+print(cloud.nearest(4.2, 7.1, k=3))             # Output: [47, 57, 48]
+index = cloud.insert(4.3, 7.2)
+print(index, cloud.nearest(4.2, 7.1, k=1))      # Output: 100 [100]
+print(cloud[index])                             # Output: PointView(index=100, x=4.3, y=7.2)
+match cloud[47]:
+    case PointView(x, y):
+        print(x, y)                             # Output: 4.0 7.0
+
+# 6. Benchmark
+# Memory used by `count` points, measured with `tracemalloc`, then the average latency of the queries:
+# `nearest(p, 10)` and `within` a small box, by scanning a list of `Point` objects and with a `PointCloud`.
+# Scanning the list is slow, so it runs fewer queries. Pass `count=1_000_000` (or more) for the full benchmark.
+
+import random
+import time
+import tracemalloc
+
+def _traced(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+def _latency(query, queries):
+    start = time.perf_counter()
+    for args in queries:
+        query(*args)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+def benchmark_point_cloud(count=200_000, queries=1000, scans=10, k=10):
+    rng = random.Random(0)
+    coordinates = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(count)]
+    # `x + 0.0` creates new float objects, as reading the points from a file would
+    points, points_size = _traced(lambda: [Point(x + 0.0, y + 0.0) for x, y in coordinates])
+    cloud, cloud_size = _traced(lambda: PointCloud([x for x, _ in coordinates], [y for _, y in coordinates]))
+    print(f"memory: list of Point {points_size / count:6.1f} bytes/point, PointCloud {cloud_size / count:6.1f} bytes/point")
+
+    targets = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(queries)]
+    boxes = [(x, y, x + 10, y + 10) for x, y in targets]
+
+    def scan_nearest(x, y):
+        return heapq.nsmallest(k, points, key=lambda p: (p.x - x) ** 2 + (p.y - y) ** 2)
+
+    def scan_within(xmin, ymin, xmax, ymax):
+        return [p for p in points if xmin <= p.x <= xmax and ymin <= p.y <= ymax]
+
+    results = {
+        f"nearest(k={k}), list": _latency(scan_nearest, targets[:scans]),
+        f"nearest(k={k}), PointCloud": _latency(lambda x, y: cloud.nearest(x, y, k), targets),
+        "within(10x10), list": _latency(scan_within, boxes[:scans]),
+        "within(10x10), PointCloud": _latency(cloud.within, boxes),
+        "insert, PointCloud": _latency(cloud.insert, targets),
+    }
+    for name, microseconds in results.items():
+        print(f"{name:<28} {microseconds:12.1f} µs/query")
+
+benchmark_point_cloud()
+# Output (numbers depend on your machine):
+# memory: list of Point  104.1 bytes/point, PointCloud   26.1 bytes/point
+# nearest(k=10), list                ~50000 µs/query
+# nearest(k=10), PointCloud              ~50 µs/query
+# within(10x10), list                 ~8000 µs/query
+# within(10x10), PointCloud              ~20 µs/query
+# insert, PointCloud                    ~2.5 µs/query
+# The list scans grow with the number of points, while the grid queries depend only on the points near the query.
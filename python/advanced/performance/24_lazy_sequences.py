@@ -0,0 +1,253 @@
+# 1. Reversing by building a list
+# `Countdown` of the reversed dunder method section returns a `range` from `__reversed__`:
+# it works because `range` is lazy.
+# A custom sequence usually does `list(reversed(items))` or `items[::-1]` instead, which builds a full copy:
+# O(n) memory before the first item is even used.
+
+class Countdown:
+    def __init__(self, start):
+        self.start = start
+
+    def __reversed__(self):
+        return range(self.start, 0, -1)
+
+countdown = Countdown(5)
+print(list(reversed(countdown)))  # Output: [5, 4, 3, 2, 1]
+
+# 2. `LazySequence`: a base class with lazy reversal and slicing
+# A subclass implements `__len__` and `_item(i)`, which returns item `i` for `0 <= i < len(self)`.
+# The base class (a `collections.abc.Sequence`) then provides, in O(1) memory:
+# - `__iter__` and `__reversed__` with `map(self._item, range(...))`: one C-level loop, no list,
+# - `__getitem__` with negative indices, and slices with any step (including negative ones) that return a
+#   `SequenceView`: a view stores a `range` of indices into its base sequence, not the items.
+#   Slicing a view slices its `range`, so views of views stay one level deep,
+# - `__contains__` that compares the items one by one in C (`value in iterator`) and stops at the first match.
+# `index()` and `count()` come from `collections.abc.Sequence`.
+# `__len__` and `_item` are abstract methods: a subclass that forgets one of them can't be instantiated.
+
+from abc import abstractmethod
+from collections.abc import Sequence
+
+class LazySequence(Sequence):
+    __slots__ = ()
+
+    @abstractmethod
+    def __len__(self):
+        pass
+
+    @abstractmethod
+    def _item(self, index):
+        pass
+
+    def __iter__(self):
+        return map(self._item, range(len(self)))
+
+    def __reversed__(self):
+        return map(self._item, range(len(self) - 1, -1, -1))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SequenceView(self, range(len(self))[index])
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(index)
+
+    def __contains__(self, value):
+        return value in iter(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}([{', '.join(map(repr, self))}])"
+
+class SequenceView(LazySequence):
+    __slots__ = ("base", "indices")
+
+    def __init__(self, base, indices):
+        self.base = base
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def _item(self, index):
+        return self.base._item(self.indices[index])
+
+    def __iter__(self):
+        return map(self.base._item, self.indices)
+
+    def __reversed__(self):
+        return map(self.base._item, reversed(self.indices))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SequenceView(self.base, self.indices[index])
+        return self.base._item(self.indices[index])
+
+class Squares(LazySequence):
+    __slots__ = ("size",)
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def _item(self, index):
+        return index * index
+
+squares = Squares(10)
+print(list(reversed(squares)))    # Output: [81, 64, 49, 36, 25, 16, 9, 4, 1, 0]
+print(squares[::-3])              # Output: SequenceView([81, 36, 9, 0])
+print(squares[8:2:-2][1:], 49 in squares)  # Output: SequenceView([36, 16]) True
+try:
+    LazySequence()
+except TypeError as e:
+    print(e)  # Output (Python 3.11): Can't instantiate abstract class LazySequence with abstract methods __len__, _item
+
+# 3. Fast path: arithmetic ranges
+# When the items are an arithmetic progression, a `range` already does everything in C and in O(1):
+# `ArithmeticSequence` hands reversal, slicing and `in` (computed, not searched) to its `range`.
+# `LazyCountdown` is a subclass that counts down from `start` to 1, like `Countdown`.
+
+class ArithmeticSequence(LazySequence):
+    __slots__ = ("numbers",)
+
+    def __init__(self, start, stop, step=1):
+        self.numbers = range(start, stop, step)
+
+    @classmethod
+    def from_range(cls, numbers):
+        sequence = cls.__new__(cls)
+        sequence.numbers = numbers
+        return sequence
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def _item(self, index):
+        return self.numbers[index]
+
+    def __iter__(self):
+        return iter(self.numbers)
+
+    def __reversed__(self):
+        return reversed(self.numbers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArithmeticSequence.from_range(self.numbers[index])
+        return self.numbers[index]
+
+    def __contains__(self, value):
+        return value in self.numbers
+
+class LazyCountdown(ArithmeticSequence):
+    __slots__ = ()
+
+    def __init__(self, start):
+        super().__init__(start, 0, -1)
+
+countdown = LazyCountdown(5)
+print(list(countdown), list(reversed(countdown)))  # Output: [5, 4, 3, 2, 1] [1, 2, 3, 4, 5]
+print(countdown[::-2], 10**18 in LazyCountdown(10**18))  # Output: ArithmeticSequence([1, 3, 5]) True
+
+# 4. Fast path: memoryview-backed data
+# A `memoryview` can be sliced with any step, including negative ones, without copying: the view only changes
+# its start, length and stride. `BufferSequence` wraps one, so reversal and slicing create a new view in O(1),
+# and iteration, `in` and `reversed()` run in C over the underlying buffer (`array`, `bytes`, NumPy array...).
+
+class BufferSequence(LazySequence):
+    __slots__ = ("view",)
+
+    def __init__(self, data):
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        if view.ndim != 1:
+            raise ValueError("Only one-dimensional buffers are supported.")
+        self.view = view
+
+    def __len__(self):
+        return len(self.view)
+
+    def _item(self, index):
+        return self.view[index]
+
+    def __iter__(self):
+        return iter(self.view)
+
+    def __reversed__(self):
+        return iter(self.view[::-1])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return BufferSequence(self.view[index])
+        return self.view[index]
+
+    def __contains__(self, value):
+        return value in self.view
+
+from array import array
+
+readings = BufferSequence(array("d", [0.5, 1.5, 2.5, 3.5]))
+backwards = readings[::-1]
+print(list(backwards), backwards.view.obj is readings.view.obj)  # Output: [3.5, 2.5, 1.5, 0.5] True
+
+# 5. Benchmark
+# Summing `size` items backwards, after a copy with `list(reversed(...))` and with the lazy reversal, for a computed
+# sequence (`Squares`, plus the default `Sequence.__reversed__`, which calls `self[i]` in a Python loop), the original
+# `Countdown`, a float64 buffer and its `[::-2]` slice, then an `in` test for a missing value.
+# `tracemalloc` measures the peak memory used during each test, and the time is the best of 3 runs.
+
+import time
+import tracemalloc
+
+def _measure(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+def benchmark_reversal(size=1_000_000):
+    squares = Squares(size)
+    countdown = LazyCountdown(size)
+    buffer = array("d", range(size))
+    data = BufferSequence(buffer)
+    tests = {
+        "Squares, list(reversed())": lambda: sum(list(reversed(squares))),
+        "Squares, Sequence reversed": lambda: sum(Sequence.__reversed__(squares)),
+        "Squares, lazy reversed()": lambda: sum(reversed(squares)),
+        "Countdown, list(reversed())": lambda: sum(list(reversed(Countdown(size)))),
+        "LazyCountdown, reversed()": lambda: sum(reversed(countdown)),
+        "buffer, list(reversed())": lambda: sum(list(reversed(buffer))),
+        "buffer, lazy reversed()": lambda: sum(reversed(data)),
+        "buffer, array [::-2]": lambda: sum(buffer[::-2]),
+        "buffer, lazy [::-2]": lambda: sum(data[::-2]),
+        "Squares, -1 in list()": lambda: -1 in list(squares),
+        "Squares, -1 in (lazy)": lambda: -1 in squares,
+    }
+    for name, func in tests.items():
+        seconds, peak = _measure(func)
+        print(f"{name:<28} {seconds * 1000:8.1f} ms {peak / 1024:10.1f} KB peak")
+
+benchmark_reversal()
+# Output (numbers depend on your machine):
+# Squares, list(reversed())       ~190 ms    ~39000 KB peak
+# Squares, Sequence reversed      ~600 ms        ~0 KB peak
+# Squares, lazy reversed()        ~120 ms        ~0 KB peak
+# Countdown, list(reversed())      ~40 ms    ~39000 KB peak
+# LazyCountdown, reversed()        ~20 ms        ~0 KB peak
+# buffer, list(reversed())         ~45 ms    ~31000 KB peak
+# buffer, lazy reversed()          ~13 ms        ~0 KB peak
+# buffer, array [::-2]             ~10 ms     ~3900 KB peak
+# buffer, lazy [::-2]               ~8 ms        ~0 KB peak
+# Squares, -1 in list()           ~180 ms    ~39000 KB peak
+# Squares, -1 in (lazy)           ~150 ms        ~0 KB peak
+# The lazy versions use a constant amount of memory and skip the copy. The default `Sequence.__reversed__` is lazy
+# too, but its Python loop makes it the slowest: the `map` over a `range` is what makes the lazy reversal fast.